@@ -0,0 +1,28 @@
+import random
+import time
+
+from timestamp import Timestamp
+from timestamp.agg import WindowCounter
+
+
+def events(count, tz, seed=0):
+    rng = random.Random(seed)
+    start = 1_600_000_000
+    times = sorted(start + rng.uniform(0, 6 * 3_600) for _ in range(count))
+    return [(Timestamp.fromtimestamp(t, tzinfo=tz), rng.randint(1, 100)) for t in times]
+
+
+def main(count=200_000):
+    for tz in ('UTC', 'America/New_York'):
+        items = events(count, tz)
+        for frame, size, sliding in (('minute', 1, False), ('hour', 1, False), ('minute', 5, True)):
+            counter = WindowCounter(frame, tz=tz, size=size, sliding=sliding)
+            t0 = time.perf_counter()
+            windows = sum(1 for _ in counter.update(items)) + sum(1 for _ in counter.flush())
+            elapsed = time.perf_counter() - t0
+            name = '{} x{}{}'.format(frame, size, ' sliding' if sliding else '')
+            print('{:<17} {:<18} {:>6,} windows  {:>10,.0f} events/s'.format(tz, name, windows, count / elapsed))
+
+
+if __name__ == '__main__':
+    main()
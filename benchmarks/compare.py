@@ -0,0 +1,34 @@
+import random
+import time
+import timeit
+
+from timestamp import Timestamp
+
+
+def main(count=200_000, number=100_000):
+    rng = random.Random(0)
+    items = [Timestamp.fromtimestamp(rng.randint(0, 2_000_000_000), tzinfo='UTC') for _ in range(count)]
+
+    t0 = time.perf_counter()
+    ordered = sorted(items)
+    t1 = time.perf_counter()
+    keyed = sorted(items, key=lambda ts: ts.datetime)
+    t2 = time.perf_counter()
+    assert ordered == keyed
+    print('sort {:,} timestamps {:.3f}s  (datetime key {:.3f}s)'.format(count, t1 - t0, t2 - t1))
+
+    a, b = items[0], items[1]
+    cases = [
+        ('timestamp', b),
+        ('aware datetime', b.datetime),
+        ('naive datetime', b.naive),
+        ('date', b.date),
+        ('str', b.isoformat()),
+    ]
+    for label, other in cases:
+        elapsed = timeit.timeit(lambda: a < other, number=number)
+        print('< {:<16} {:>12,.0f}/s'.format(label, number / elapsed))
+
+
+if __name__ == '__main__':
+    main()
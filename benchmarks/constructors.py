@@ -0,0 +1,23 @@
+import timeit
+
+from timestamp import Timestamp
+
+
+def main(number=50_000):
+    ts = Timestamp(2020, 3, 4, 5, 6, 7, 123456, tzinfo='America/New_York')
+    dt = ts.datetime
+    cases = [
+        ('__init__', lambda: Timestamp(2020, 3, 4, 5, 6, 7, 123456, tzinfo=ts.tzinfo)),
+        ('_wrap', lambda: Timestamp._wrap(dt)),
+        ('copy', lambda: ts.copy()),
+        ('shift', lambda: ts.shift(hours=1)),
+        ('to', lambda: ts.to('UTC')),
+        ('span', lambda: ts.span('day')),
+    ]
+    for label, fn in cases:
+        elapsed = timeit.timeit(fn, number=number)
+        print('{:<10} {:>12,.0f}/s'.format(label, number / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+import time
+
+from timestamp import Timestamp
+
+FORMAT = 'YYYY-MM-DD HH:mm:ss.SSSSSSZZ'
+
+
+def main(rows=200_000):
+    start = Timestamp(2020, 1, 1, tzinfo='America/New_York')
+    items = [start.shift(seconds=i * 37) for i in range(rows)]
+
+    t0 = time.perf_counter()
+    single = [ts.format(FORMAT) for ts in items]
+    t1 = time.perf_counter()
+    batch = Timestamp.format_many(items, FORMAT)
+    t2 = time.perf_counter()
+
+    assert single == batch
+    print('{:,} rows  format {:.3f}s  format_many {:.3f}s  x{:.1f}'.format(
+        rows, t1 - t0, t2 - t1, (t1 - t0) / (t2 - t1)
+    ))
+
+
+if __name__ == '__main__':
+    main()
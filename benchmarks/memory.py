@@ -0,0 +1,39 @@
+import gc
+import sys
+import tracemalloc
+
+from timestamp import Timestamp
+
+
+class DictTimestamp(Timestamp):
+    pass
+
+
+def measure(cls, count):
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    items = [cls(2020, 1, 1, second=i % 60, microsecond=i % 1_000_000) for i in range(count)]
+    end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in end.compare_to(start, 'filename'))
+    instance = items[0]
+    shallow = sys.getsizeof(instance)
+    if hasattr(instance, '__dict__'):
+        shallow += sys.getsizeof(instance.__dict__)
+    datetime = sys.getsizeof(instance.datetime)
+    list_slot = sys.getsizeof(items) / count
+    return shallow, datetime, (allocated - list_slot * count) / count
+
+
+def main(count=1_000_000):
+    for label, cls in (('__dict__', DictTimestamp), ('__slots__', Timestamp)):
+        shallow, datetime, traced = measure(cls, count)
+        print('{:<10} getsizeof {:>4}B (+{}B datetime)  tracemalloc {:>6.1f}B/instance over {:,}'.format(
+            label, shallow, datetime, traced, count
+        ))
+
+
+if __name__ == '__main__':
+    main()
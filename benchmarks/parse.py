@@ -0,0 +1,47 @@
+import random
+import time
+
+from dateutil.parser import parse as dtp
+
+from timestamp import Timestamp
+from timestamp.parser import IsoParser
+
+TEMPLATES = [
+    'YYYY-MM-DDTHH:mm:ss[Z]',
+    'YYYY-MM-DDTHH:mm:ss.SSSSSSZZ',
+    'YYYY-MM-DD HH:mm:ssZZ',
+    'YYYY-MM-DDTHH:mm:ss.SSS[Z]',
+    'YYYY-MM-DD',
+    'MMM D YYYY h:mm A',
+    'dddd, MMMM D, YYYY',
+]
+
+
+def corpus(count, seed=0):
+    rng = random.Random(seed)
+    start = Timestamp(2000, 1, 1, tzinfo='America/New_York')
+    return [
+        start.shift(seconds=rng.randint(0, 25 * 365 * 86_400), microseconds=rng.randint(0, 999_999))
+        .format(rng.choice(TEMPLATES))
+        for _ in range(count)
+    ]
+
+
+def main(count=50_000):
+    strings = corpus(count)
+
+    t0 = time.perf_counter()
+    baseline = [Timestamp.get(dtp(s), tzinfo='UTC') for s in strings]
+    t1 = time.perf_counter()
+    fallbacks = IsoParser.fallbacks
+    fast = [Timestamp.get(s) for s in strings]
+    t2 = time.perf_counter()
+
+    assert [ts.timestamp for ts in baseline] == [ts.timestamp for ts in fast]
+    print('{:,} strings  dateutil {:,.0f}/s  get {:,.0f}/s  x{:.1f}  dateutil fallbacks {:,}'.format(
+        count, count / (t1 - t0), count / (t2 - t1), (t1 - t0) / (t2 - t1), IsoParser.fallbacks - fallbacks
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+import os
+import random
+import tempfile
+import time
+
+from timestamp import Timestamp, io
+
+
+def write(path, count, seed=0):
+    rng = random.Random(seed)
+    start = Timestamp(2000, 1, 1)
+    with open(path, 'w') as f:
+        for i in range(count):
+            ts = start.shift(seconds=rng.randint(0, 25 * 365 * 86_400), microseconds=rng.randint(0, 999_999))
+            f.write('{} INFO worker-{} request {} completed\n'.format(ts.format('YYYY-MM-DDTHH:mm:ss.SSSSSS[Z]'), i % 8, i))
+
+
+def main(count=500_000):
+    cores = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'timestamps.log')
+        write(path, count)
+
+        baseline = None
+        expected = None
+        for workers in sorted({1, 2, 4, 8, cores}):
+            t0 = time.perf_counter()
+            result = io.parse_file(path, workers=workers)
+            elapsed = time.perf_counter() - t0
+
+            if baseline is None:
+                baseline, expected = elapsed, result.values
+            assert result.values == expected
+            print('{:>2} workers  {:>10,.0f} lines/s  x{:.2f}'.format(workers, count / elapsed, baseline / elapsed))
+    print(f'{cores} cores available')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,22 @@
+import time
+
+from timestamp import Timestamp
+
+
+def main():
+    start = Timestamp(2020, 1, 1, tzinfo='America/New_York')
+    cases = [
+        ('minute', start.shift(years=1)),
+        ('hour', start.shift(years=10)),
+        ('day', start.shift(years=100)),
+        ('month', start.shift(years=1000)),
+    ]
+    for frame, end in cases:
+        t0 = time.perf_counter()
+        count = sum(1 for _ in Timestamp.range(frame, start, end))
+        elapsed = time.perf_counter() - t0
+        print('{:<8} {:>9,} steps {:.3f}s  {:>12,.0f} steps/s'.format(frame, count, elapsed, count / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+import time
+
+from timestamp import Timestamp
+
+CASES = [
+    {'seconds': 30},
+    {'minutes': -15},
+    {'hours': 1},
+    {'days': 30},
+    {'weeks': 2},
+    {'months': 1},
+    {'quarters': -1},
+    {'years': 1, 'months': 2, 'days': 3},
+]
+
+
+def measure(fn, count):
+    t0 = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return count / (time.perf_counter() - t0)
+
+
+def main(count=100_000):
+    for tz in ('UTC', 'America/New_York'):
+        ts = Timestamp(2020, 3, 4, 5, 6, 7, 123456, tzinfo=tz)
+        for kwargs in CASES:
+            assert ts.shift(**kwargs) == ts._shift_relative(dict(kwargs))
+            before = measure(lambda: ts._shift_relative(dict(kwargs)), count)
+            after = measure(lambda: ts.shift(**kwargs), count)
+            name = ', '.join(f'{k}={v}' for k, v in kwargs.items())
+            print('{:<17} {:<28} {:>10,.0f} -> {:>10,.0f} shifts/s  x{:.2f}'.format(tz, name, before, after, after / before))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+MODULES = (
+    'timestamp',
+    'dateutil.tz',
+    'dateutil.parser',
+    'dateutil.relativedelta',
+    'calendar',
+    'bson',
+)
+
+
+def importtime(statement):
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def run(statement='import timestamp', runs=20):
+    importtime(statement)
+    samples = [importtime(statement) for _ in range(runs)]
+    names = set().union(*samples)
+    medians = {name: statistics.median(s.get(name, 0) for s in samples) for name in names}
+    top = sorted((n for n in names if '.' not in n or n.startswith('timestamp')), key=medians.get, reverse=True)
+    return {
+        'python': sys.version.split()[0],
+        'statement': statement,
+        'runs': runs,
+        'total_us': medians.get('timestamp'),
+        'loaded': [m for m in MODULES if m in names],
+        'modules_us': {name: medians[name] for name in top[:15]},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.startup', description='import time of timestamp')
+    parser.add_argument('-n', '--runs', type=int, default=20)
+    parser.add_argument('-s', '--statement', default='import timestamp')
+    parser.add_argument('-o', '--output', help='write the JSON report to this file')
+    parser.add_argument('-c', '--compare', help='baseline JSON report to compare against')
+    args = parser.parse_args(argv)
+
+    report = run(args.statement, args.runs)
+    print('{}: {:,.0f}us median over {} runs'.format(report['statement'], report['total_us'], report['runs']))
+    print('loaded: {}'.format(', '.join(report['loaded'])))
+    for name, value in report['modules_us'].items():
+        print('  {:<28} {:>8,.0f}us'.format(name, value))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print('baseline {:,.0f}us  x{:.2f}'.format(baseline['total_us'], baseline['total_us'] / report['total_us']))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,178 @@
+import argparse
+import fnmatch
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from dateutil import tz as dtz
+
+from timestamp import Timestamp
+from timestamp.index import TimestampIndex
+
+
+def cases():
+    rng = random.Random(0)
+    ts = Timestamp(2020, 3, 4, 5, 6, 7, 123456, tzinfo='America/New_York')
+    other = ts.shift(hours=1)
+    aware = datetime(2020, 3, 4, 5, 6, 7, 123456, tzinfo=dtz.gettz('America/New_York'))
+    naive = aware.replace(tzinfo=None)
+    items = [Timestamp.fromtimestamp(rng.randint(0, 2_000_000_000), tzinfo='UTC') for _ in range(1_000)]
+    ordered = sorted(items)
+    index = TimestampIndex(items)
+    start, end = Timestamp(2020, 1, 1), Timestamp(2020, 2, 1)
+
+    return {
+        'init': lambda: Timestamp(2020, 3, 4, 5, 6, 7, 123456, tzinfo='America/New_York'),
+        'get.timestamp': lambda: Timestamp.get(ts),
+        'get.datetime.aware': lambda: Timestamp.get(aware),
+        'get.datetime.naive': lambda: Timestamp.get(naive),
+        'get.date': lambda: Timestamp.get(aware.date()),
+        'get.int': lambda: Timestamp.get(1_583_316_367),
+        'get.float': lambda: Timestamp.get(1_583_316_367.123456),
+        'get.str.iso': lambda: Timestamp.get('2020-03-04T05:06:07.123456+00:00'),
+        'get.str.numeric': lambda: Timestamp.get('1583316367'),
+        'get.str.fallback': lambda: Timestamp.get('March 4 2020 5:06 AM'),
+        'fromtimestamp': lambda: Timestamp.fromtimestamp(1_583_316_367.123456, tzinfo='America/New_York'),
+        'format.default': lambda: ts.format(),
+        'format.tokens': lambda: ts.format('dddd, MMMM Do YYYY h:mm:ss.SSS A ZZ'),
+        'format.isoformat': lambda: ts.isoformat(),
+        'shift.hours': lambda: ts.shift(hours=5),
+        'shift.days': lambda: ts.shift(days=30),
+        'shift.months': lambda: ts.shift(months=1),
+        'span.day': lambda: ts.span('day'),
+        'span.week': lambda: ts.span('week'),
+        'span.month': lambda: ts.span('month'),
+        'floor.hour': lambda: ts.floor('hour'),
+        'ceil.year': lambda: ts.ceil('year'),
+        'bucketize.hour.1000': lambda: Timestamp.bucketize(ordered, 'hour'),
+        'index.between.1000': lambda: index[index.between(start, end)],
+        'isbetween.1000': lambda: [i for i in items if i.isbetween(start, end, '[)')],
+        'range.day': lambda: list(Timestamp.range('day', start, end)),
+        'spanrange.day': lambda: list(Timestamp.spanrange('day', start, end)),
+        'interval.day': lambda: list(Timestamp.interval('day', start, end, interval=7)),
+        'compare.lt': lambda: ts < other,
+        'compare.eq': lambda: ts == other,
+        'compare.datetime': lambda: ts < aware,
+        'sort.1000': lambda: sorted(items),
+        'to': lambda: ts.to('Asia/Tokyo'),
+        'xlate.yesterday': lambda: Timestamp.xlate('yesterday'),
+        'xlate.relative': lambda: Timestamp.xlate('-30days'),
+        'humanize': lambda: ts.humanize(),
+    }
+
+
+def measure(fn, duration):
+    fn()
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= duration:
+            break
+        number *= 2 if elapsed < duration / 10 else 1 + int(duration / max(elapsed, 1e-9))
+
+    samples = min(number, 100)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        peak = 0
+        for _ in range(samples):
+            _reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            fn()
+            peak += tracemalloc.get_traced_memory()[1] - current
+
+        gc.collect()
+        before = tracemalloc.take_snapshot()
+        kept = [fn() for _ in range(samples)]
+        after = tracemalloc.take_snapshot()
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+        del kept
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'ops_per_sec': number / elapsed,
+        'peak_bytes': peak / samples,
+        'blocks': blocks / samples,
+    }
+
+
+def _reset_peak():
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.stop()
+        tracemalloc.start()
+
+
+def run(pattern='*', duration=0.2):
+    results = {}
+    for name, fn in cases().items():
+        if fnmatch.fnmatch(name, pattern):
+            results[name] = measure(fn, duration)
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': datetime.now().isoformat(),
+        'results': results,
+    }
+
+
+def compare(report, baseline, threshold):
+    regressions = []
+    for name, result in report['results'].items():
+        old = baseline['results'].get(name)
+        if old is None:
+            print('{:<22} {:>14,.0f}/s  {:>8.0f}B {:>7.1f} blocks  (new)'.format(
+                name, result['ops_per_sec'], result['peak_bytes'], result['blocks']
+            ))
+            continue
+        ratio = result['ops_per_sec'] / old['ops_per_sec']
+        flag = ''
+        if ratio < 1 - threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print('{:<22} {:>14,.0f}/s  x{:.2f}  {:>8.0f}B ({:+.0f}B) {:>7.1f} blocks ({:+.1f}){}'.format(
+            name, result['ops_per_sec'], ratio, result['peak_bytes'], result['peak_bytes'] - old['peak_bytes'],
+            result['blocks'], result['blocks'] - old.get('blocks', 0), flag
+        ))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Timestamp hot path benchmarks')
+    parser.add_argument('-k', '--filter', default='*', help='fnmatch pattern of cases to run')
+    parser.add_argument('-d', '--duration', type=float, default=0.2, help='seconds per case')
+    parser.add_argument('-o', '--output', help='write the JSON report to this file')
+    parser.add_argument('-c', '--compare', help='baseline JSON report to compare against')
+    parser.add_argument('-t', '--threshold', type=float, default=0.1, help='allowed ops/sec drop before failing')
+    args = parser.parse_args(argv)
+
+    report = run(args.filter, args.duration)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print('{} regression(s): {}'.format(len(regressions), ', '.join(regressions)))
+            return 1
+    elif not args.output:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -20,7 +20,7 @@ setuptools.setup(
     description='tz aware timestamps made simple',
     long_description=long_description,
     log_description_content_type='text/markdown',
-    packages=setuptools.find_packages(exclude=['tests']),
+    packages=setuptools.find_packages(exclude=['tests', 'benchmarks', 'benchmarks.*']),
     install_requires=install_requires,
     tests_require=['pytest'],
     python_requires=">=3.7",
@@ -0,0 +1,76 @@
+import random
+from collections import Counter
+from datetime import timedelta
+
+from timestamp import Timestamp
+from timestamp.agg import WindowCounter
+
+
+def events(tz, count=2_000, hours=6, seed=0):
+    rng = random.Random(seed)
+    times = sorted(1_604_196_000 + rng.uniform(0, hours * 3_600) for _ in range(count))
+    return [(Timestamp.fromtimestamp(t, tzinfo=tz), rng.randint(1, 100)) for t in times]
+
+
+def test_tumbling_counts_match_floor():
+    for tz in ('UTC', 'America/New_York'):
+        items = events(tz)
+        counter = WindowCounter('minute', tz=tz, lateness=timedelta(hours=2))
+        windows = list(counter.update(items)) + list(counter.flush())
+
+        expected = Counter(ts.floor('minute') for ts, _ in items)
+        assert [(w.start, w.count) for w in windows] == sorted(expected.items())
+        assert sum(w.total for w in windows) == sum(v for _, v in items)
+        assert counter.dropped == 0
+        assert len(counter) == 0
+
+
+def test_repeated_hour_without_lateness_drops_second_pass():
+    items = events('America/New_York')
+    counter = WindowCounter('minute', tz='America/New_York')
+    windows = list(counter.update(items)) + list(counter.flush())
+
+    late = sum(1 for (prev, _), (ts, _) in zip(items, items[1:]) if ts.floor('minute') < prev.floor('minute'))
+    assert late and counter.dropped >= late
+    assert sum(w.count for w in windows) + counter.dropped == len(items)
+
+
+def test_tumbling_windows_follow_spanrange_across_dst():
+    items = events('America/New_York', hours=8)
+    counter = WindowCounter('hour', tz='America/New_York', empty=True)
+    windows = list(counter.update(items)) + list(counter.flush())
+    spans = list(Timestamp.spanrange('hour', windows[0].start, windows[-1].start, tz='America/New_York'))
+    assert [(w.start, w.end) for w in windows] == spans
+
+
+def test_min_max_mean():
+    counter = WindowCounter('hour')
+    pairs = [(Timestamp(2020, 1, 1, 0, m), v) for m, v in [(1, 5), (2, -3), (3, 10)]]
+    [window] = list(counter.update(pairs)) + list(counter.flush())
+    assert (window.count, window.total, window.min, window.max, window.mean) == (3, 12, -3, 10, 4)
+
+
+def test_sliding_sums():
+    items = events('UTC')
+    counter = WindowCounter('minute', size=5, sliding=True)
+    windows = list(counter.update(items)) + list(counter.flush())
+    for window in windows:
+        inside = [v for ts, v in items if window.start <= ts <= window.end]
+        assert window.count == len(inside)
+        assert window.total == sum(inside)
+
+
+def test_late_events_are_dropped():
+    counter = WindowCounter('minute')
+    base = Timestamp(2020, 1, 1)
+    list(counter.update([(base, 1), (base.shift(minutes=2), 1)]))
+    assert not counter.add(base.shift(seconds=30), 1)
+    assert counter.dropped == 1
+
+
+def test_retention_evicts_oldest():
+    counter = WindowCounter('minute', lateness=3_600, retention=2)
+    base = Timestamp(2020, 1, 1)
+    windows = list(counter.update((base.shift(minutes=i), 1) for i in range(5)))
+    assert [w.start for w in windows] == [base.shift(minutes=i) for i in range(3)]
+    assert counter.evicted == 3
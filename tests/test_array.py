@@ -0,0 +1,103 @@
+import pytest
+
+from timestamp import Timestamp, util
+
+np = pytest.importorskip('numpy')
+from timestamp.array import TimestampArray  # noqa: E402
+
+TZ = 'America/New_York'
+TRANSITIONS = [1583650800, 1604210400, 1615705200, 1636264800]
+
+
+def epochs():
+    values = []
+    for moment in TRANSITIONS:
+        values.extend(moment + offset for offset in range(-3 * 3_600 - 900, 3 * 3_600 + 900, 450))
+    values.extend([0, 951_782_400, 1_709_251_199])
+    return values
+
+
+@pytest.fixture
+def scalars():
+    return [Timestamp.fromtimestamp(v, tzinfo=TZ) for v in epochs()]
+
+
+@pytest.fixture
+def array():
+    return TimestampArray(np.array(epochs(), dtype='int64') * 1_000_000, TZ)
+
+
+def us(items):
+    return [util.epoch_us(item.datetime) for item in items]
+
+
+def isoformats(items):
+    return [item.isoformat() for item in items]
+
+
+def test_iteration_and_indexing(array, scalars):
+    assert len(array) == len(scalars)
+    assert isoformats(array) == isoformats(scalars)
+    for i in (0, 7, 20, -1):
+        assert array[i].isoformat() == scalars[i].isoformat()
+    assert isoformats(array[10:20]) == isoformats(scalars[10:20])
+
+
+@pytest.mark.parametrize('field', ['year', 'quarter', 'month', 'day', 'week'])
+def test_fields(array, scalars, field):
+    assert getattr(array, field).tolist() == [getattr(ts, field) for ts in scalars]
+
+
+@pytest.mark.parametrize('frame', ['year', 'quarter', 'month', 'week', 'day', 'hour', 'minute', 'second'])
+@pytest.mark.parametrize('bounds', ['[)', '[]', '()'])
+def test_span_matches_scalar(array, scalars, frame, bounds):
+    lower, upper = array.span(frame, bounds=bounds)
+    expected = [ts.span(frame, bounds=bounds) for ts in scalars]
+    assert lower.values.tolist() == us(e[0] for e in expected)
+    assert upper.values.tolist() == us(e[1] for e in expected)
+
+
+@pytest.mark.parametrize('frame', ['day', 'hour'])
+def test_floor_and_ceil(array, scalars, frame):
+    assert array.floor(frame).values.tolist() == us(ts.floor(frame) for ts in scalars)
+    assert array.ceil(frame).values.tolist() == us(ts.ceil(frame) for ts in scalars)
+
+
+def test_span_count(array, scalars):
+    lower, upper = array.span('hour', count=3)
+    assert upper.values.tolist() == us(ts.span('hour', count=3)[1] for ts in scalars)
+
+
+@pytest.mark.parametrize('kwargs', [{'hours': 1}, {'minutes': -45}, {'days': 1}, {'weeks': -1}, {'seconds': 90}])
+def test_shift_matches_scalar(array, scalars, kwargs):
+    assert isoformats(array.shift(**kwargs)) == isoformats(ts.shift(**kwargs) for ts in scalars)
+
+
+def test_shift_rejects_calendar_frames(array):
+    with pytest.raises(ValueError):
+        array.shift(months=1)
+
+
+def test_format_and_to(array, scalars):
+    assert array.format('YYYY-MM-DD HH:mm:ss ZZ') == [ts.format('YYYY-MM-DD HH:mm:ss ZZ') for ts in scalars]
+    assert isoformats(array.to('UTC')) == isoformats(Timestamp.fromtimestamp(v, tzinfo='UTC') for v in epochs())
+    assert array.to_utc().values.tolist() == array.values.tolist()
+
+
+def test_isbetween(array, scalars):
+    start, end = scalars[5], scalars[40]
+    assert array.isbetween(start, end, '[)').tolist() == [ts.isbetween(start, end, '[)') for ts in scalars]
+
+
+def test_fromitems(scalars):
+    array = TimestampArray.fromitems(scalars)
+    assert array.tz == TZ
+    assert isoformats(array) == isoformats(scalars)
+    assert TimestampArray.fromitems(['2020-01-01T00:00:00Z'], tz='UTC').values.tolist() == [1_577_836_800_000_000]
+
+
+def test_empty():
+    array = TimestampArray([], TZ)
+    assert len(array) == 0
+    assert list(array.floor('day')) == []
+    assert list(array.shift(hours=1)) == []
@@ -0,0 +1,40 @@
+import gc
+
+from timestamp import Timestamp
+from timestamp.buckets import Bucketizer
+
+
+def live_timestamps():
+    gc.collect()
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, Timestamp))
+
+
+def test_keys_match_floor_and_share_instances():
+    items = [Timestamp(2020, 1, 1).shift(minutes=7 * i) for i in range(100)]
+    keys = list(Timestamp.bucketize(items, 'hour'))
+    assert keys == [item.floor('hour') for item in items]
+    for i in range(1, len(keys)):
+        if keys[i] == keys[i - 1]:
+            assert keys[i] is keys[i - 1]
+    assert len({id(key) for key in keys}) == len(set(keys))
+
+
+def test_repeated_buckets_share_instances():
+    items = [0, 3_600, 60, 7_200, 120, 3_660]
+    keys = list(Bucketizer(Timestamp, 'hour').keys(items))
+    assert keys[0] is keys[2] is keys[4]
+    assert keys[1] is keys[5]
+
+
+def test_streaming_memory_is_bounded():
+    size = Bucketizer._INTERNED_SIZE
+    keys = Bucketizer(Timestamp, 'minute').keys(i * 30 for i in range(size * 40))
+    baseline = live_timestamps()
+    last = None
+    for i, key in enumerate(keys):
+        last = key
+        if i == size * 20:
+            middle = live_timestamps()
+    assert middle - baseline <= size + 1
+    assert live_timestamps() - baseline <= size + 1
+    assert last == Timestamp.fromtimestamp((size * 40 - 1) * 30).floor('minute')
@@ -0,0 +1,121 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from timestamp import Timestamp, clocks
+
+FIXED = datetime(2020, 5, 6, 7, 8, 9, tzinfo=timezone.utc)
+NOW = Timestamp(2020, 5, 6, 7, 8, 9)
+
+
+class FixedClock(clocks.Clock):
+    def __call__(self):
+        return FIXED
+
+
+@pytest.fixture
+def fixed():
+    previous = clocks.set_clock(FixedClock())
+    yield
+    clocks.set_clock(previous)
+
+
+def test_clock_is_abstract():
+    with pytest.raises(TypeError):
+        clocks.Clock()
+    assert FixedClock().now(Timestamp.tzparser('Asia/Tokyo')).hour == 16
+
+
+def test_system_clock():
+    before = datetime.now(timezone.utc)
+    value = clocks.SystemClock()()
+    assert before <= value <= datetime.now(timezone.utc)
+
+
+def test_set_and_get_clock(fixed):
+    clock = clocks.get_clock()
+    assert isinstance(clock, FixedClock)
+    assert Timestamp.now() == NOW
+    assert Timestamp.now('America/New_York').isoformat() == '2020-05-06T03:08:09-04:00'
+
+    previous = clocks.set_clock(lambda: FIXED + timedelta(days=1))
+    assert previous is clock
+    assert Timestamp.now().day == 7
+
+    clocks.set_clock(None)
+    assert isinstance(clocks.get_clock(), clocks.SystemClock)
+    clocks.set_clock(previous)
+
+
+def test_explicit_clock_overrides_global(fixed):
+    assert Timestamp.now(clock=lambda: FIXED + timedelta(hours=1)).hour == 8
+    assert Timestamp.now().hour == 7
+
+
+def test_coarse_clock_holds_value_within_resolution():
+    clock = clocks.CoarseClock(resolution=60_000)
+    first = clock()
+    time.sleep(0.01)
+    assert clock() is first
+    assert clock.now(timezone.utc) == first
+
+
+def test_coarse_clock_advances():
+    clock = clocks.CoarseClock(resolution=1)
+    first = clock()
+    time.sleep(0.01)
+    assert clock() > first
+
+
+@pytest.mark.parametrize('anchor', [0, 60])
+def test_coarse_clock_drift(anchor):
+    clock = clocks.CoarseClock(resolution=5, anchor=anchor)
+    for _ in range(20):
+        drift = abs(clock() - datetime.now(timezone.utc))
+        assert drift < timedelta(milliseconds=50)
+        time.sleep(0.002)
+
+
+def test_coarse_clock_zones():
+    clock = clocks.CoarseClock(resolution=60_000)
+    tokyo = Timestamp.tzparser('Asia/Tokyo')
+    value = clock.now(tokyo)
+    assert value.tzinfo is tokyo
+    assert value == clock()
+    assert clock.now(tokyo) is value
+
+
+def test_coarse_clock_shared_across_threads():
+    clock = clocks.CoarseClock(resolution=60_000)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(clock())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(value) for value in results}) == 1
+
+
+def test_coarse_clock_rejects_resolution():
+    with pytest.raises(ValueError):
+        clocks.CoarseClock(resolution=0)
+
+
+def test_humanize_many(fixed):
+    items = [
+        NOW.shift(minutes=-5),
+        NOW.shift(hours=3).to('Asia/Tokyo'),
+        NOW.shift(days=-40).isoformat(),
+        NOW.shift(days=-800).to('America/New_York'),
+    ]
+    converted = [item if Timestamp.is_self(item) else Timestamp.get(item) for item in items]
+    expected = [item.humanize(now=NOW) for item in converted]
+    assert expected[:2] == ['5 minutes ago', 'in 3 hours']
+    assert Timestamp.humanize_many(items) == expected
+    assert Timestamp.humanize_many(items, now=NOW.isoformat()) == expected
+    assert Timestamp.humanize_many(items, now=NOW.shift(days=1)) == [
+        item.humanize(now=NOW.shift(days=1)) for item in converted
+    ]
+    assert Timestamp.humanize_many([]) == []
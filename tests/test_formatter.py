@@ -0,0 +1,98 @@
+import pytest
+
+from benchmarks.formatter import regex_format
+from timestamp import Timestamp
+from timestamp.formatter import Formatter, FormatPlan
+
+FORMATS = [
+    'YYYY-MM-DD HH:mm:ssZZ',
+    'YYYY-MM-DDTHH:mm:ss.SSSSSSZ',
+    'YY M D H m s SS SSS SSSS SSSSS',
+    'dddd ddd d, MMMM MMM D YYYY h:mm A a hh',
+    'DDDD DDD W X x ZZZ',
+    '[week] W [of] YYYY',
+    '[YYYY-MM-DD] YYYY',
+    '[]YYYY[]',
+    '[[nested] MM',
+    'YYYY [unclosed',
+    '{YYYY}-{{MM}}',
+    '[{literal}] [}{] {0} {} %s',
+    'plain text without tokens?!',
+    '',
+]
+MOMENTS = [
+    Timestamp(2020, 3, 4, 5, 6, 7, 123456, tzinfo='America/New_York'),
+    Timestamp(2021, 1, 1, 0, 0, 0, tzinfo='UTC'),
+    Timestamp(1999, 12, 31, 12, 59, 59, 999999, tzinfo='Asia/Kolkata'),
+    Timestamp(2020, 11, 1, 13, 30, tzinfo='Australia/Lord_Howe'),
+    Timestamp(2004, 2, 29, 23, 0, 0, 5, tzinfo='-03:30'),
+]
+
+
+@pytest.mark.parametrize('fmt', FORMATS)
+def test_plans_match_previous_formatter(fmt):
+    plan = Formatter.compile(fmt)
+    for ts in MOMENTS:
+        expected = regex_format(ts, fmt)
+        assert plan(ts) == expected
+        assert plan(ts.datetime) == expected
+        assert Formatter(ts, fmt) == expected
+        assert ts.format(fmt) == expected
+
+
+def test_literals():
+    ts = MOMENTS[0]
+    assert ts.format('[week] W [of] YYYY') == 'week 2020-W10-3 of 2020'
+    assert ts.format('[YYYY] YYYY') == 'YYYY 2020'
+    assert ts.format('{YYYY} [{x}]') == '{2020} {x}'
+    assert ts.format('[[a] [') == '[a ['
+
+
+def test_ordinal_day():
+    expected = {1: '1st', 2: '2nd', 3: '3rd', 4: '4th', 11: '11th', 12: '12th', 13: '13th', 21: '21st', 22: '22nd', 23: '23rd', 31: '31st'}
+    for day, ordinal in expected.items():
+        assert Timestamp(2020, 1, day).format('Do MMMM') == f'{ordinal} January'
+
+
+def test_tenths_of_a_second():
+    assert Timestamp(2020, 1, 1, 0, 0, 0, 987654).format('s.S') == '0.9'
+    assert Timestamp(2020, 1, 1, 0, 0, 0, 99999).format('S') == '0'
+
+
+def test_compile_is_cached():
+    assert Formatter.compile('YYYY-MM') is Formatter.compile('YYYY-MM')
+    assert isinstance(Formatter.compile('YYYY'), FormatPlan)
+    assert repr(Formatter.compile('YYYY')) == "FormatPlan('YYYY')"
+
+
+@pytest.mark.parametrize('fmt', FORMATS)
+def test_format_many(fmt):
+    expected = [ts.format(fmt) for ts in MOMENTS]
+    assert Formatter.format_many(MOMENTS, fmt) == expected
+    assert Formatter.format_many([ts.datetime for ts in MOMENTS], fmt) == expected
+    assert Formatter.format_many(iter(MOMENTS), fmt) == expected
+    assert Timestamp.format_many(MOMENTS, fmt) == expected
+
+
+def test_format_many_stream():
+    consumed = []
+
+    def moments():
+        for ts in MOMENTS:
+            consumed.append(ts)
+            yield ts
+
+    results = Formatter.format_many(moments(), 'YYYY-MM-DD', stream=True)
+    assert not isinstance(results, list) and consumed == []
+    assert next(results) == '2020-03-04'
+    assert len(consumed) == 1
+    assert list(results) == [ts.format('YYYY-MM-DD') for ts in MOMENTS[1:]]
+
+
+def test_format_many_default_format():
+    assert Timestamp.format_many(MOMENTS[:1]) == ['2020-03-04 05:06:07-05:00']
+
+
+def test_format_many_empty():
+    assert Formatter.format_many([], 'YYYY') == []
+    assert list(Formatter.format_many([], 'YYYY', stream=True)) == []
@@ -0,0 +1,92 @@
+import math
+
+import pytest
+
+from timestamp import Timestamp, util
+
+SECONDS = [0, 1, 951_782_400, 1_583_650_799, 1_583_650_800, 1_604_210_400, 1_700_000_000, 4_102_444_800]
+
+
+def isoformats(items):
+    return [ts.isoformat() for ts in items]
+
+
+def expected(seconds, tz=None):
+    return isoformats(Timestamp.fromtimestamp(s, tzinfo=Timestamp.tzparser(tz)) for s in seconds)
+
+
+@pytest.mark.parametrize('tz', [None, 'America/New_York', 'Asia/Kolkata', '-03:30'])
+@pytest.mark.parametrize('unit, scale', [('s', 1), ('ms', 1_000), ('us', 1_000_000), ('ns', 1_000_000_000)])
+def test_auto_detects_unit(tz, unit, scale):
+    values = [s * scale for s in SECONDS]
+    assert isoformats(Timestamp.fromtimestamps(values, tz=tz)) == expected(SECONDS, tz)
+    assert isoformats(Timestamp.fromtimestamps(values, unit=unit, tz=tz)) == expected(SECONDS, tz)
+
+
+def test_unit_is_detected_per_array():
+    assert util.timestamp_unit(1_700_000_000) == 's'
+    assert util.timestamp_unit(1_700_000_000_000) == 'ms'
+    assert util.timestamp_unit(1_700_000_000_000_000) == 'us'
+    assert util.timestamp_unit(1_700_000_000_000_000_000) == 'ns'
+    millis = Timestamp.fromtimestamps([5, 1_700_000_000_000])
+    assert isoformats(millis) == expected([0.005, 1_700_000_000])
+
+
+def test_mixed_int_and_float():
+    values = [1_700_000_000, 1_700_000_000.5, 1_700_000_000.000001, -1.25, 86_400]
+    assert isoformats(Timestamp.fromtimestamps(values)) == expected(values)
+    assert isoformats(Timestamp.fromtimestamps((v * 1000 for v in values))) == expected(values)
+
+
+def test_nanoseconds_round_half_even():
+    values = [1_500, 2_500, 2_501, 1_700_000_000_000_000_000]
+    assert util.epoch_us_many(values, 'ns') == [2, 2, 3, 1_700_000_000_000_000]
+
+
+def test_explicit_unit():
+    assert Timestamp.fromtimestamps([1_700_000_000], unit='ms')[0] == Timestamp.fromtimestamp(1_700_000)
+    with pytest.raises(ValueError):
+        Timestamp.fromtimestamps([1], unit='minutes')
+
+
+@pytest.mark.parametrize('values', [
+    [util.MIN_TIMESTAMP - 1],
+    [0, -1e30],
+    [1e30],
+    [util.MAX_TIMESTAMP + 1, 0],
+])
+def test_bounds(values):
+    with pytest.raises(ValueError):
+        Timestamp.fromtimestamps(values, unit='s')
+
+
+def test_auto_rejects_values_beyond_nanoseconds():
+    with pytest.raises(ValueError):
+        Timestamp.fromtimestamps([1e30])
+
+
+@pytest.mark.parametrize('value', [True, False, math.nan, math.inf, -math.inf, '1700000000', None])
+def test_rejects_non_numbers(value):
+    with pytest.raises(ValueError):
+        Timestamp.fromtimestamps([1_700_000_000, value])
+
+
+def test_empty():
+    assert Timestamp.fromtimestamps([]) == []
+    assert Timestamp.fromtimestamps(iter(())) == []
+
+
+def test_numpy_input():
+    np = pytest.importorskip('numpy')
+    values = np.array(SECONDS, dtype='int64') * 1_000
+    assert isoformats(Timestamp.fromtimestamps(values, tz='America/New_York')) == expected(SECONDS, 'America/New_York')
+    assert isoformats(Timestamp.fromtimestamps(values.astype('float64') / 1_000)) == expected(SECONDS)
+    with pytest.raises(ValueError):
+        Timestamp.fromtimestamps(np.array([1.0, np.nan]))
+
+
+def test_compact():
+    pytest.importorskip('numpy')
+    array = Timestamp.fromtimestamps([s * 1_000 for s in SECONDS], tz='America/New_York', compact=True)
+    assert array.values.tolist() == [s * 1_000_000 for s in SECONDS]
+    assert array.tz == 'America/New_York'
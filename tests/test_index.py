@@ -0,0 +1,122 @@
+import random
+from bisect import bisect_left, bisect_right
+
+import pytest
+
+from timestamp import Timestamp, util
+from timestamp.index import TimestampIndex
+
+
+def items(count=200, seed=0):
+    rng = random.Random(seed)
+    start = Timestamp(2020, 3, 1, tzinfo='America/New_York')
+    values = [start.shift(minutes=rng.randint(0, 30 * 24 * 60)) for _ in range(count)]
+    values[10] = values[11]
+    return values
+
+
+@pytest.fixture
+def index():
+    return TimestampIndex(items())
+
+
+def keys(values):
+    return sorted(util.epoch_us(v.datetime) for v in values)
+
+
+def test_sorted_view(index):
+    assert len(index) == 200
+    assert list(index) == sorted(items(), key=lambda ts: util.epoch_us(ts.datetime))
+    assert list(index.values) == keys(items())
+    assert [items()[i] for i in index.positions] == list(index)
+    assert index[0] == min(items()) and index[-1] == max(items())
+    assert index[5:8] == list(index)[5:8]
+    assert items()[0] in index
+    assert items()[0].shift(microseconds=1) not in index
+
+
+@pytest.mark.parametrize('bounds', ['[)', '[]', '()', '(]'])
+def test_between(index, bounds):
+    values = items()
+    for start, end in [(values[0], values[1]), (values[1], values[0]), (values[10], values[10]), (values[3], values[3].shift(days=5))]:
+        selected = index[index.between(start, end, bounds)]
+        lo, hi = util.epoch_us(start.datetime), util.epoch_us(end.datetime)
+        lower = (lambda k: k >= lo) if bounds[0] == '[' else (lambda k: k > lo)
+        upper = (lambda k: k <= hi) if bounds[1] == ']' else (lambda k: k < hi)
+        assert keys(selected) == [k for k in keys(values) if lower(k) and upper(k)]
+
+
+def test_between_rejects_bad_bounds(index):
+    with pytest.raises(ValueError):
+        index.between(items()[0], items()[1], '[[')
+
+
+@pytest.mark.parametrize('inclusive', [True, False])
+def test_before_after(index, inclusive):
+    values = items()
+    for moment in (values[10], values[50].shift(seconds=1), Timestamp(2000, 1, 1), Timestamp(2030, 1, 1)):
+        key = util.epoch_us(moment.datetime)
+        before = keys(index[index.before(moment, inclusive)])
+        after = keys(index[index.after(moment, inclusive)])
+        assert before == [k for k in keys(values) if (k <= key if inclusive else k < key)]
+        assert after == [k for k in keys(values) if (k >= key if inclusive else k > key)]
+
+
+def test_accepts_other_inputs(index):
+    moment = items()[20]
+    utc = moment.to('UTC')
+    for value in (moment, moment.datetime, utc, utc.isoformat(), utc.timestamp):
+        assert index.before(value, inclusive=True) == index.before(moment, inclusive=True)
+    with pytest.raises(ValueError):
+        index.before('not a date')
+
+
+def test_nearest(index):
+    values = keys(items())
+    for moment in (items()[0], items()[0].shift(seconds=1), Timestamp(2000, 1, 1), Timestamp(2030, 1, 1)):
+        key = util.epoch_us(moment.datetime)
+        found = index.nearest(moment)
+        assert abs(values[found] - key) == min(abs(v - key) for v in values)
+
+
+def test_nearest_prefers_earlier_on_tie():
+    index = TimestampIndex([Timestamp(2020, 1, 1), Timestamp(2020, 1, 1, 0, 2)])
+    assert index.nearest(Timestamp(2020, 1, 1, 0, 1)) == 0
+
+
+@pytest.mark.parametrize('side', ['left', 'right'])
+def test_searchsorted(index, side):
+    search = bisect_left if side == 'left' else bisect_right
+    moments = [items()[i] for i in (0, 10, 99)] + [Timestamp(2000, 1, 1), Timestamp(2030, 1, 1)]
+    expected = [search(keys(items()), util.epoch_us(m.datetime)) for m in moments]
+    assert index.searchsorted(moments, side=side) == expected
+
+
+@pytest.mark.parametrize('side', ['left', 'right'])
+def test_searchsorted_numpy(index, side):
+    np = pytest.importorskip('numpy')
+    moments = [items()[i] for i in (0, 10, 99)] + [Timestamp(2000, 1, 1)]
+    expected = index.searchsorted(moments, side=side)
+
+    epochs = np.array([m.timestamp for m in moments])
+    assert index.searchsorted(epochs, side=side).tolist() == expected
+    datetimes = np.array([util.epoch_us(m.datetime) for m in moments], dtype='M8[us]')
+    assert index.searchsorted(datetimes, side=side).tolist() == expected
+
+
+def test_searchsorted_rejects_bad_side(index):
+    with pytest.raises(ValueError):
+        index.searchsorted([], side='middle')
+
+
+def test_empty():
+    index = TimestampIndex([])
+    moment = Timestamp(2020, 1, 1)
+    assert len(index) == 0 and list(index) == []
+    assert moment not in index
+    assert index.between(moment, moment.shift(days=1)) == slice(0, 0)
+    assert index.before(moment) == slice(0, 0)
+    assert index.after(moment) == slice(0, 0)
+    assert index.searchsorted([moment]) == [0]
+    with pytest.raises(ValueError):
+        index.nearest(moment)
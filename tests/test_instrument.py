@@ -0,0 +1,118 @@
+import pytest
+
+import timestamp
+from timestamp import Timestamp, instrument, parser
+
+
+def originals():
+    owners = instrument._owners()
+    return {(owner, attr): owners[owner].__dict__[attr] for owner, attr in instrument._TARGETS}
+
+
+@pytest.fixture(autouse=True)
+def restore():
+    before = originals()
+    yield before
+    instrument.disable()
+    instrument.reset()
+    assert originals() == before
+
+
+def test_enable_patches_and_disable_restores(restore):
+    assert not instrument.enabled
+    instrument.enable()
+    assert instrument.enabled
+    patched = originals()
+    assert all(patched[key] is not raw for key, raw in restore.items())
+
+    instrument.enable()
+    assert originals() == patched
+
+    instrument.disable()
+    assert not instrument.enabled
+    assert all(originals()[key] is raw for key, raw in restore.items())
+
+
+def test_patched_methods_behave_the_same():
+    ts = Timestamp(2020, 3, 7, 2, 30, tzinfo='America/New_York')
+    expected = (ts.shift(days=1).isoformat(), ts.format('YYYY-MM-DD'), Timestamp.get('2020-01-02').isoformat())
+    instrument.enable()
+    assert (ts.shift(days=1).isoformat(), ts.format('YYYY-MM-DD'), Timestamp.get('2020-01-02').isoformat()) == expected
+    assert Timestamp.fromtimestamp.__name__ == 'fromtimestamp'
+
+
+def test_stats_counts_calls():
+    instrument.enable()
+    ts = Timestamp(2020, 3, 7, 2, 30, tzinfo='America/New_York')
+    for _ in range(3):
+        ts.shift(hours=1)
+    ts.shift(days=1)
+
+    stats = timestamp.stats()
+    shift = stats['timings']['Timestamp.shift']
+    assert shift['count'] == 4
+    assert sum(shift['buckets'].values()) == 4
+    assert shift['min_us'] <= shift['mean_us'] <= shift['max_us']
+    assert shift['p50_us'] <= shift['p99_us']
+    assert stats['counters']['Timestamp.shift.imaginary'] == 1
+
+    assert timestamp.stats(reset=True) == stats
+    assert timestamp.stats() == {'counters': {}, 'timings': {}}
+
+
+def test_disabled_records_nothing():
+    Timestamp(2020, 3, 7, 2, 30, tzinfo='America/New_York').shift(days=1)
+    assert instrument.snapshot() == {'counters': {}, 'timings': {}}
+
+
+def test_profile_is_scoped(restore):
+    ts = Timestamp(2020, 1, 1)
+    with instrument.profile() as collector:
+        assert instrument.enabled
+        ts.shift(days=1)
+        parser.TzInfo.parse('Asia/Tokyo')
+        with instrument.profile() as inner:
+            ts.shift(days=2)
+    assert not instrument.enabled
+    assert originals() == restore
+    ts.shift(days=3)
+
+    snapshot = collector.snapshot()
+    assert snapshot['timings']['Timestamp.shift']['count'] == 2
+    assert snapshot['timings']['TzInfo.parse']['count'] == 1
+    assert inner.snapshot()['timings']['Timestamp.shift']['count'] == 1
+    assert instrument.snapshot() == {'counters': {}, 'timings': {}}
+
+
+def test_profile_with_global_enabled(restore):
+    instrument.enable()
+    ts = Timestamp(2020, 1, 1)
+    with instrument.profile() as collector:
+        ts.shift(days=1)
+    assert instrument.enabled
+    ts.shift(days=1)
+    assert collector.snapshot()['timings']['Timestamp.shift']['count'] == 1
+    assert timestamp.stats()['timings']['Timestamp.shift']['count'] == 2
+
+    instrument.disable()
+    assert originals() == restore
+
+
+def test_profile_restores_on_error(restore):
+    with pytest.raises(RuntimeError):
+        with instrument.profile():
+            raise RuntimeError
+    assert not instrument.enabled
+    assert originals() == restore
+
+
+def test_histogram():
+    histogram = instrument.Histogram()
+    for micros in (1, 2, 3, 100, 1000):
+        histogram.add(micros / 1_000_000)
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 5
+    assert snapshot['min_us'] == pytest.approx(1) and snapshot['max_us'] == pytest.approx(1000)
+    assert snapshot['buckets'] == {2: 1, 4: 2, 128: 1, 1024: 1}
+    assert snapshot['p50_us'] == 4 and snapshot['p99_us'] == 1024
+    assert instrument.Histogram().snapshot()['mean_us'] is None
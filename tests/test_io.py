@@ -0,0 +1,145 @@
+from array import array
+
+import pytest
+
+from timestamp import Timestamp, io, util
+
+
+def write(path, lines, newline='\n', trailing=True):
+    text = newline.join(lines) + (newline if trailing else '')
+    path.write_bytes(text.encode())
+    return str(path)
+
+
+def epoch(string):
+    return util.epoch_us(Timestamp.get(string).datetime)
+
+
+def log_lines(count):
+    start = Timestamp(2020, 1, 1)
+    return ['{} INFO request {}'.format(start.shift(seconds=i * 37, microseconds=i).isoformat(), i) for i in range(count)]
+
+
+@pytest.mark.parametrize('workers', [1, 2, 3])
+def test_parse_file_returns_epochs_in_order(tmp_path, workers):
+    lines = log_lines(500)
+    path = write(tmp_path / 'log.txt', lines)
+    result = io.parse_file(path, workers=workers)
+    assert isinstance(result.values, array) and result.values.typecode == 'q'
+    assert result.values.tolist() == [epoch(line.split()[0]) for line in lines]
+    assert result.invalid == 0
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parse_file_error_modes(tmp_path, workers):
+    lines = log_lines(300)
+    for i in range(0, 300, 50):
+        lines[i] = 'garbage INFO request {}'.format(i)
+    path = write(tmp_path / 'log.txt', lines)
+    expected = [None if line.startswith('garbage') else epoch(line.split()[0]) for line in lines]
+
+    skipped = io.parse_file(path, workers=workers, errors='skip')
+    assert skipped.values.tolist() == [v for v in expected if v is not None]
+    assert skipped.invalid == 6
+
+    coerced = io.parse_file(path, workers=workers, errors='coerce')
+    assert coerced.values.tolist() == [io.NAT if v is None else v for v in expected]
+    assert coerced.invalid == 6
+
+    with pytest.raises(ValueError):
+        io.parse_file(path, workers=workers)
+
+
+def test_parse_file_columns_and_format(tmp_path):
+    path = write(tmp_path / 'data.csv', ['a,01/02/2020 03:04,x', 'b,31/12/1999 23:59,y'])
+    result = io.parse_file(path, column=1, delimiter=',', fmt='%d/%m/%Y %H:%M', workers=1)
+    assert result.values.tolist() == [epoch('2020-02-01T03:04:00Z'), epoch('1999-12-31T23:59:00Z')]
+
+
+def test_parse_file_empty(tmp_path):
+    path = write(tmp_path / 'empty.txt', [], trailing=False)
+    assert io.parse_file(path, workers=2) == io.ParseResult(array('q'), 0)
+
+
+def test_parse_file_invalid_workers(tmp_path):
+    path = write(tmp_path / 'log.txt', log_lines(1))
+    with pytest.raises(ValueError):
+        io.parse_file(path, workers=0)
+
+
+def scanned(path, **kwargs):
+    return [value for chunk in io.scan(path, **kwargs) for value in chunk]
+
+
+def test_scan_yields_timestamps_in_chunks(tmp_path):
+    lines = log_lines(25)
+    path = write(tmp_path / 'log.txt', lines)
+    chunks = list(io.scan(path, chunksize=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert [ts.isoformat() for chunk in chunks for ts in chunk] == [line.split()[0] for line in lines]
+    assert scanned(path, epoch=True) == [epoch(line.split()[0]) for line in lines]
+
+
+@pytest.mark.parametrize('column, delimiter, lines', [
+    (0, None, ['2020-01-01T00:00:00Z a b', '  2020-01-02T00:00:00Z\tc']),
+    (2, None, ['a b 2020-01-01T00:00:00Z c', 'x\ty  2020-01-02T00:00:00Z']),
+    (1, ',', ['a,2020-01-01T00:00:00Z,b', ',2020-01-02T00:00:00Z,']),
+    (2, '|', ['a|b|2020-01-01T00:00:00Z', 'c||2020-01-02T00:00:00Z']),
+    (1, b';', ['a;2020-01-01T00:00:00Z', 'b;2020-01-02T00:00:00Z;c']),
+])
+def test_scan_field_selection(tmp_path, column, delimiter, lines):
+    path = write(tmp_path / 'data.txt', lines)
+    assert scanned(path, column=column, delimiter=delimiter, epoch=True) == [
+        epoch('2020-01-01T00:00:00Z'), epoch('2020-01-02T00:00:00Z'),
+    ]
+
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+@pytest.mark.parametrize('trailing', [True, False])
+def test_scan_line_endings(tmp_path, newline, trailing):
+    lines = ['2020-01-01T00:00:00Z', '', '2020-01-02T00:00:00Z', '2020-01-03T00:00:00Z']
+    path = write(tmp_path / 'data.txt', lines, newline, trailing)
+    expected = [epoch(line) for line in lines if line]
+    assert scanned(path, epoch=True) == expected
+    assert scanned(path, column=0, delimiter=',', epoch=True) == expected
+
+
+def test_scan_line_ranges(tmp_path):
+    lines = log_lines(200)
+    path = write(tmp_path / 'log.txt', lines, trailing=False)
+    data = (tmp_path / 'log.txt').read_bytes()
+
+    ranges = io._ranges(path, 7)
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    for (_, stop), (start, _) in zip(ranges, ranges[1:]):
+        assert stop == start and data[start - 1:start] == b'\n'
+
+    values = []
+    for start, stop in ranges:
+        values.extend(io._parse_range(path, 0, None, None, None, 'raise', start, stop)[0])
+    assert values == scanned(path, epoch=True)
+
+
+def test_scan_error_modes(tmp_path):
+    path = write(tmp_path / 'data.txt', ['2020-01-01T00:00:00Z', 'nope', '2020-01-02T00:00:00Z'])
+    with pytest.raises(ValueError):
+        scanned(path)
+    assert scanned(path, epoch=True, errors='coerce') == [epoch('2020-01-01T00:00:00Z'), None, epoch('2020-01-02T00:00:00Z')]
+    assert len(scanned(path, errors='skip')) == 2
+
+
+def test_scan_empty_file(tmp_path):
+    assert scanned(write(tmp_path / 'empty.txt', [], trailing=False)) == []
+    assert scanned(write(tmp_path / 'blank.txt', ['', '  ', ''])) == []
+
+
+@pytest.mark.parametrize('kwargs', [{'column': -1}, {'delimiter': ',,'}, {'delimiter': '\n'}, {'chunksize': 0}])
+def test_scan_invalid_arguments(tmp_path, kwargs):
+    path = write(tmp_path / 'data.txt', ['2020-01-01T00:00:00Z'])
+    with pytest.raises(ValueError):
+        scanned(path, **kwargs)
+
+
+def test_scan_empty_field_is_invalid(tmp_path):
+    path = write(tmp_path / 'data.csv', ['a,2020-01-01T00:00:00Z', 'b,', 'c,2020-01-02T00:00:00Z'])
+    assert scanned(path, column=1, delimiter=',', epoch=True, errors='coerce')[1] is None
@@ -0,0 +1,96 @@
+import pytest
+from dateutil.parser import ParserError
+from dateutil.parser import parse as dateutil_parse
+
+from timestamp import Timestamp
+from timestamp.parser import IsoParser
+
+FAST = [
+    '2020-01-02',
+    '2020-01-02T03:04',
+    '2020-01-02T03:04:05',
+    '2020-01-02 03:04:05',
+    '2020-01-02t03:04:05',
+    '2020-01-02T03:04:05Z',
+    '2020-01-02T03:04:05z',
+    '2020-01-02T03:04:05.1Z',
+    '2020-01-02T03:04:05.123456Z',
+    '2020-01-02T03:04:05,250+01:00',
+    '2020-01-02T03:04:05.1234567890Z',
+    '2020-01-02T03:04:05+05:30',
+    '2020-01-02T03:04:05-0800',
+    '2020-01-02T03:04:05+09',
+    '2020-01-02T03:04:05 +02:00',
+    '2020-01-02T03:04:05+00:00',
+    '2020-01-02T03:04:05-00:00',
+    '2020-01-02T03:04+01:00',
+    '2020-02-29T23:59:59.999999-12:00',
+    '1969-12-31T23:59:59Z',
+]
+FALLBACK = [
+    '2020-W01-3',
+    '2020W013',
+    '2020-123',
+    '2020-02-30',
+    '2020-13-01T00:00:00Z',
+    '2020-01-02T24:00:00',
+    '2020-01-02T03:04:05+25:00',
+    '2020-01-02T03:04:05+05:30:15',
+    'January 2, 2020 3:04 PM',
+    '02/01/2020 03:04',
+    '20200102T030405',
+    'not a date',
+]
+
+
+def reference(string, tz=None):
+    try:
+        dt = dateutil_parse(string)
+    except ParserError:
+        return None
+    return Timestamp.get(dt, tzinfo=Timestamp.tzparser(tz))
+
+
+def describe(ts):
+    return None if ts is None else (ts.isoformat(), ts.utcoffset)
+
+
+@pytest.mark.parametrize('tz', [None, 'America/New_York'])
+@pytest.mark.parametrize('string', FAST)
+def test_fast_path_matches_dateutil(string, tz):
+    before = IsoParser.fallbacks
+    assert describe(Timestamp.get(string, tzinfo=tz)) == describe(reference(string, tz))
+    assert IsoParser.fallbacks == before
+
+
+@pytest.mark.parametrize('tz', [None, 'America/New_York'])
+@pytest.mark.parametrize('string', FALLBACK)
+def test_fallback_matches_dateutil(string, tz):
+    before = IsoParser.fallbacks
+    assert describe(Timestamp.get(string, tzinfo=tz)) == describe(reference(string, tz))
+    assert IsoParser.fallbacks == before + 1
+
+
+@pytest.mark.parametrize('string', FAST)
+def test_parse_matches_dateutil_offsets(string):
+    dt = IsoParser.parse(string)
+    expected = dateutil_parse(string)
+    assert dt == expected and dt.replace(tzinfo=None) == expected.replace(tzinfo=None)
+    assert dt.utcoffset() == expected.utcoffset()
+
+
+def test_non_strings_fall_back():
+    before = IsoParser.fallbacks
+    with pytest.raises(TypeError):
+        IsoParser.parse(None)
+    assert IsoParser.fallbacks == before
+
+
+def test_fraction_truncates_to_microseconds():
+    assert IsoParser.match('2020-01-02T03:04:05.1234567Z').microsecond == 123456
+    assert IsoParser.match('2020-01-02T03:04:05.5').microsecond == 500000
+
+
+def test_match_rejects_invalid():
+    for string in ('2020-02-30', '2020-01-02T25:00', '2020-01-02T00:00+24:00', '2020-01-02X', '2020-1-2'):
+        assert IsoParser.match(string) is None
@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from timestamp import Timestamp
+from timestamp.parser import BulkParser
+
+SAMPLES = BulkParser._SAMPLES
+ISO = ['2020-01-{:02d}T03:04:05.{:06d}'.format(i % 28 + 1, i) for i in range(40)]
+EPOCHS = [1_577_836_800 + i * 3_601.5 for i in range(40)]
+MIXED = [
+    '2020-01-02T03:04:05Z', 1_577_836_800, '1577836800.25', 1_577_836_800.5,
+    datetime(2020, 1, 2, 3, 4, 5), datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    Timestamp(2020, 5, 6), 'January 2, 2020', '2020-01-02 03:04', '20200102',
+]
+
+
+def parsed(bulk, items, errors='raise'):
+    return [None if ts is None else ts.isoformat() for ts in bulk.parse(items, errors=errors)]
+
+
+def expected(items, tz=None):
+    return [Timestamp.get(item, tzinfo=Timestamp.tzparser(tz)).isoformat() for item in items]
+
+
+@pytest.mark.parametrize('tz', [None, 'America/New_York'])
+@pytest.mark.parametrize('items', [ISO, EPOCHS, [str(e) for e in EPOCHS], MIXED, MIXED[::-1], ISO + MIXED + EPOCHS])
+def test_matches_get(items, tz):
+    assert parsed(BulkParser(Timestamp, tz=tz), items) == expected(items, tz)
+    assert [ts.isoformat() for ts in Timestamp.parse_many(items, tz=tz)] == expected(items, tz)
+
+
+@pytest.mark.parametrize('items, shape', [
+    (ISO, '_iso'),
+    (EPOCHS, '_epoch'),
+    ([str(e) for e in EPOCHS], '_epoch'),
+    (['January 2, 2020'] * 20, '_generic'),
+    ([], '_generic'),
+    ([True, None], '_generic'),
+    (ISO[:9] + EPOCHS[:7], '_iso'),
+    (EPOCHS[:9] + ISO[:7], '_epoch'),
+])
+def test_infers_most_common_shape(items, shape):
+    assert BulkParser(Timestamp).infer(items).__name__ == shape
+
+
+def test_inference_uses_first_samples_only():
+    items = ISO[:SAMPLES] + EPOCHS
+    bulk = BulkParser(Timestamp)
+    assert parsed(bulk, items) == expected(items)
+    assert bulk.parser.__name__ == '_iso'
+
+    items = EPOCHS[:SAMPLES] + ISO
+    bulk = BulkParser(Timestamp)
+    assert parsed(bulk, items) == expected(items)
+    assert bulk.parser.__name__ == '_epoch'
+
+
+def test_fmt_is_strict():
+    bulk = BulkParser(Timestamp, fmt='%d/%m/%Y')
+    assert parsed(bulk, ['02/01/2020', '2020-01-02'], errors='coerce') == ['2020-01-02T00:00:00+00:00', None]
+    assert bulk.invalid == 1
+
+
+def test_error_modes_and_invalid_counter():
+    items = ISO[:5] + ['nope', None, True, '2020-13-01'] + ISO[5:10]
+    bulk = BulkParser(Timestamp)
+
+    with pytest.raises(ValueError):
+        parsed(bulk, items)
+
+    coerced = parsed(bulk, items, errors='coerce')
+    assert coerced == expected(ISO[:5]) + [None] * 4 + expected(ISO[5:10])
+    assert bulk.invalid == 4
+
+    assert parsed(bulk, items, errors='skip') == expected(ISO[:10])
+    assert bulk.invalid == 4
+
+    assert parsed(bulk, ISO) == expected(ISO)
+    assert bulk.invalid == 0
+
+
+def test_is_lazy():
+    def items():
+        yield from ISO[:SAMPLES + 1]
+        raise AssertionError('consumed too far')
+
+    results = BulkParser(Timestamp).parse(items())
+    assert next(results).isoformat() == expected(ISO[:1])[0]
+
+
+def test_invalid_errors_argument():
+    with pytest.raises(ValueError):
+        Timestamp.parse_many(ISO, errors='ignore')
@@ -0,0 +1,53 @@
+from datetime import timedelta
+
+import pytest
+from dateutil.relativedelta import FR, MO
+
+from timestamp import Timestamp
+
+CASES = [
+    {'seconds': 30},
+    {'minutes': -15},
+    {'hours': 1},
+    {'days': 30},
+    {'weeks': 2},
+    {'months': 1},
+    {'month': -13},
+    {'quarters': -1},
+    {'years': 1, 'months': 2, 'days': 3},
+    {'days': 1.5},
+    {'weekday': 0},
+    {'weekday': 4, 'days': 1},
+    {'weekday': MO(-1), 'hours': 3},
+    {'weekday': FR(2), 'months': 1},
+]
+
+
+@pytest.mark.parametrize('tz', ['UTC', 'America/New_York', 'Australia/Lord_Howe'])
+@pytest.mark.parametrize('kwargs', CASES)
+def test_matches_relativedelta(tz, kwargs):
+    for start in ((2020, 1, 31, 12), (2020, 3, 7, 2, 30), (2020, 10, 31, 1, 30), (2024, 3, 6, 12)):
+        ts = Timestamp(*start, tzinfo=tz)
+        shifted = ts.shift(**kwargs)
+        expected = ts._shift_relative({Timestamp._SHIFTS[k]: v for k, v in kwargs.items()})
+        assert shifted.isoformat() == expected.isoformat()
+
+
+def test_weekday():
+    ts = Timestamp.get('2024-03-06T12:00:00Z')
+    assert ts.shift(weekday=0) == Timestamp(2024, 3, 11, 12)
+    assert ts.shift(weekday=2) == ts
+    assert ts.shift(weekday=4, days=1) == Timestamp(2024, 3, 8, 12)
+    assert ts.shift(weekday=MO(-1)) == Timestamp(2024, 3, 4, 12)
+
+
+def test_dst_gap_is_resolved():
+    ts = Timestamp(2020, 3, 7, 2, 30, tzinfo='America/New_York')
+    shifted = ts.shift(days=1)
+    assert shifted.isoformat() == '2020-03-08T03:30:00-04:00'
+    assert shifted.utcoffset == timedelta(hours=-4)
+
+
+def test_unsupported_frame():
+    with pytest.raises(ValueError):
+        Timestamp(2020, 1, 1).shift(fortnights=1)
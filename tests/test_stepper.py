@@ -0,0 +1,62 @@
+import pytest
+
+from timestamp import Timestamp
+
+ZONES = ['UTC', 'America/New_York', 'Europe/London', 'Australia/Lord_Howe', 'America/Santiago']
+
+
+def assert_matches_range(frame, start, end=None, limit=None):
+    expected = list(Timestamp.range(frame, start, end, limit=limit))
+    view = Timestamp.rangeview(frame, start, end, limit=limit)
+
+    assert len(view) == len(expected)
+    assert list(view) == expected
+    assert list(reversed(view)) == expected[::-1]
+    for i, ts in enumerate(expected):
+        assert view[i] == ts
+        assert view[i].isoformat() == ts.isoformat()
+        assert ts in view
+        assert view.index(ts) == i
+    assert list(view[1::3]) == expected[1::3]
+    return view, expected
+
+
+@pytest.mark.parametrize('tz', ZONES)
+@pytest.mark.parametrize('day', [28, 29, 30, 31])
+@pytest.mark.parametrize('frame', ['month', 'months', 'quarter', 'year'])
+def test_month_steps_from_month_end(tz, day, frame):
+    start = Timestamp(2019, 1, day, 1, 30, tzinfo=tz)
+    view, expected = assert_matches_range(frame, start, limit=60)
+    assert len(expected) == 60
+
+    missing = expected[-1].shift(days=1)
+    assert missing not in view
+    with pytest.raises(ValueError):
+        view.index(missing)
+
+
+@pytest.mark.parametrize('tz', ZONES)
+@pytest.mark.parametrize('frame, start, end', [
+    ('hour', (2020, 3, 7), (2020, 3, 10)),
+    ('hour', (2020, 10, 31), (2020, 11, 3)),
+    ('minutes', (2020, 4, 4, 22), (2020, 4, 5, 4)),
+    ('day', (2020, 1, 1, 2, 30), (2021, 1, 1)),
+    ('week', (2019, 12, 29, 0, 30), (2021, 1, 1)),
+])
+def test_fixed_steps_across_dst(tz, frame, start, end):
+    assert_matches_range(frame, Timestamp(*start, tzinfo=tz), Timestamp(*end, tzinfo=tz))
+
+
+def test_month_end_clipping():
+    view = Timestamp.rangeview('month', Timestamp(2020, 1, 31), limit=5)
+    assert [ts.day for ts in view] == [31, 29, 31, 30, 31]
+    assert Timestamp(2020, 2, 29) in view
+    assert Timestamp(2020, 2, 28) not in view
+
+
+def test_empty_and_limited():
+    start = Timestamp(2020, 1, 1)
+    assert len(Timestamp.rangeview('day', start, start.shift(days=-1))) == 0
+    assert len(Timestamp.rangeview('day', start, start.shift(days=10), limit=3)) == 3
+    with pytest.raises(IndexError):
+        Timestamp.rangeview('day', start, limit=3)[3]
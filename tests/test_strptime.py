@@ -0,0 +1,138 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from timestamp import Timestamp
+
+FORMATS = [
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S.%f',
+    '%d/%m/%y %I:%M %p',
+    '%A, %B %d %Y %H:%M',
+    '%a %b %d %H:%M:%S %Y',
+    '%Y%m%d%H%M%S',
+    '%Y-%j %H:%M',
+    '%G-W%V-%u %H:%M',
+    '%Y-%m-%d %H:%M:%S%z',
+    '%Y-%m-%dT%H:%M:%S.%f%z',
+    '%d %b %Y %H:%M %z',
+]
+
+
+def samples(count=200, seed=0):
+    rng = random.Random(seed)
+    start = datetime(1950, 1, 1)
+    for _ in range(count):
+        moment = start + timedelta(seconds=rng.randint(0, 100 * 365 * 86_400), microseconds=rng.randint(0, 999_999))
+        offset = timedelta(minutes=rng.choice([0, -300, 330, 545, 600, -210]))
+        yield moment.replace(tzinfo=timezone(offset))
+
+
+def expected(string, fmt):
+    dt = datetime.strptime(string, fmt)
+    if dt.tzinfo is None:
+        return dt, timedelta(0)
+    return dt.replace(tzinfo=None), dt.utcoffset()
+
+
+@pytest.mark.parametrize('fmt', FORMATS)
+def test_matches_datetime_strptime(fmt):
+    for moment in samples():
+        string = moment.strftime(fmt)
+        ts = Timestamp.strptime(string, fmt)
+        wall, offset = expected(string, fmt)
+        assert ts.naive == wall, string
+        assert ts.utcoffset == offset, string
+
+
+@pytest.mark.parametrize('string, fmt', [
+    ('2020-13-01', '%Y-%m-%d'),
+    ('2020-02-30', '%Y-%m-%d'),
+    ('2020-01-01 25:00', '%Y-%m-%d %H:%M'),
+    ('2020-01-01x', '%Y-%m-%d'),
+    ('2020-W54-1', '%G-W%V-%u'),
+    ('2020-01-01 +2400', '%Y-%m-%d %z'),
+])
+def test_rejects_what_datetime_rejects(string, fmt):
+    with pytest.raises(ValueError):
+        datetime.strptime(string, fmt)
+    with pytest.raises(ValueError):
+        Timestamp.strptime(string, fmt)
+
+
+def test_tzinfo_applies_to_naive_formats():
+    ts = Timestamp.strptime('2020-03-08 03:30', '%Y-%m-%d %H:%M', tzinfo='America/New_York')
+    assert ts.tz == 'America/New_York'
+    assert ts.naive == datetime(2020, 3, 8, 3, 30)
+
+
+TOKEN_FORMATS = [
+    ('YYYY-MM-DDTHH:mm:ss.SSSSSSZZ', True),
+    ('YYYY-MM-DD HH:mm:ss.SSSSSSZ', True),
+    ('X', True),
+    ('x', True),
+    ('YYYY-MM-DD HH:mm:ss.SSSSSS', True),
+    ('dddd, MMMM Do YYYY h:mm:ss.SSSSSS A', True),
+    ('ddd MMM D YY hh:mm:ss.SSSSSS a', True),
+    ('W HH:mm:ss.SSSSSS', True),
+    ('DDDD YYYY HH:mm:ss.SSSSSS', True),
+    ('YYYY DDD H m s SSSSSS', True),
+    ('[at] HH[h]mm [on] DD/MM/YYYY', False),
+    ('YYYY-MM-DD', False),
+    ('M/D/YYYY h A', False),
+    ('YYYYMMDDHHmmss.SSS', False),
+    ('YYYY-MM-DDTHH:mm:ss.SZ', False),
+]
+TOKEN_MOMENTS = [
+    (2020, 3, 4, 5, 6, 7, 123456),
+    (2020, 12, 31, 23, 59, 59, 999999),
+    (2021, 1, 1, 0, 0, 0, 1),
+    (2019, 12, 30, 12, 0, 0, 500000),
+    (2000, 2, 29, 12, 30, 0, 0),
+    (1999, 1, 9, 0, 1, 2, 30),
+]
+
+
+@pytest.mark.parametrize('tz', ['UTC', 'America/New_York', 'Asia/Kolkata'])
+@pytest.mark.parametrize('fmt, lossless', TOKEN_FORMATS)
+def test_token_round_trip(fmt, lossless, tz):
+    plan = Timestamp.compile_strptime(fmt)
+    for fields in TOKEN_MOMENTS:
+        ts = Timestamp(*fields, tzinfo=tz)
+        string = ts.format(fmt)
+        parsed = plan(string, tzinfo=tz)
+        assert parsed.format(fmt) == string
+        if lossless:
+            assert parsed == ts
+            assert parsed.utcoffset == ts.utcoffset
+
+
+def test_token_offsets_are_kept():
+    ts = Timestamp(2020, 7, 1, 12, tzinfo='America/New_York')
+    parsed = Timestamp.compile_strptime('YYYY-MM-DD HH:mmZZ')(ts.format('YYYY-MM-DD HH:mmZZ'))
+    assert parsed.isoformat() == '2020-07-01T12:00:00-04:00'
+
+
+def test_token_syntax_is_detected():
+    assert Timestamp.compile_strptime('YYYY-MM-DD').tokens
+    assert not Timestamp.compile_strptime('%Y-%m-%d').tokens
+    assert Timestamp.compile_strptime('YYYY', tokens=True)('2020') == Timestamp(2020, 1, 1)
+
+
+@pytest.mark.parametrize('fmt, string', [
+    ('YYYY-MM-DD', '2020-02-30'),
+    ('YYYY-MM-DD', '2020-01-01 extra'),
+    ('YYYY-MM-DD HH', '2020-01-01 24'),
+    ('Do MMMM YYYY', '4th Smarch 2020'),
+    ('W', '2020-W54-1'),
+])
+def test_token_rejects_invalid(fmt, string):
+    with pytest.raises(ValueError):
+        Timestamp.compile_strptime(fmt)(string)
+
+
+@pytest.mark.parametrize('fmt', ['ZZZ', 'YYYY YYYY', 'MM M'])
+def test_token_rejects_unsupported_formats(fmt):
+    with pytest.raises(ValueError):
+        Timestamp.compile_strptime(fmt)
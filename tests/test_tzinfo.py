@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+import pytest
+from dateutil import tz as dtz
+
+from timestamp import Timestamp
+from timestamp.parser import TzInfo
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    TzInfo.cache_clear()
+    yield
+    TzInfo.cache_clear()
+
+
+@pytest.mark.parametrize('tz', [None, 'UTC', 'America/New_York', '+05:30', '-0800', '09'])
+def test_interned_zones_are_identical(tz):
+    first = TzInfo.parse(tz)
+    assert TzInfo.parse(tz) is first
+    assert Timestamp(2020, 1, 1, tzinfo=tz).tzinfo is first
+    assert Timestamp.now(tz).tzinfo is first
+
+
+@pytest.mark.parametrize('tz, offset', [
+    (None, 0), ('UTC', 0), ('Z', 0), ('+05:30', 330), ('-0800', -480), ('09', 540), ('Asia/Kolkata', 330),
+])
+def test_parsed_offsets(tz, offset):
+    tzinfo = TzInfo.parse(tz)
+    assert tzinfo.utcoffset(Timestamp(2020, 1, 1).naive) == timedelta(minutes=offset)
+
+
+def test_tzinfo_objects_pass_through():
+    for tzinfo in (dtz.tzutc(), dtz.gettz('Europe/Paris'), dtz.tzoffset(None, 3600)):
+        assert TzInfo.parse(tzinfo) is tzinfo
+    assert TzInfo.cache_info().currsize == 0
+
+
+def test_invalid_zone():
+    with pytest.raises(ValueError):
+        TzInfo.parse('Not/AZone')
+    assert TzInfo.parse('Not/AZone', safetz=True) == dtz.tzutc()
+    assert TzInfo.cache_info().currsize == 0
+
+
+def test_cache_info_and_clear():
+    assert TzInfo.cache_info() == (0, 0, TzInfo._INTERNED_SIZE, 0)
+    TzInfo.parse('UTC')
+    TzInfo.parse('UTC')
+    TzInfo.parse('Asia/Tokyo')
+    info = TzInfo.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+    TzInfo.cache_clear()
+    assert TzInfo.cache_info() == (0, 0, TzInfo._INTERNED_SIZE, 0)
+    TzInfo.parse('UTC')
+    assert TzInfo.cache_info().misses == 1
+
+
+def test_table_clears_when_full():
+    size = TzInfo._INTERNED_SIZE
+    for minutes in range(size):
+        TzInfo.parse('+{:02d}:{:02d}'.format(*divmod(minutes, 60)))
+    assert TzInfo.cache_info().currsize == size
+
+    TzInfo.parse('Asia/Tokyo')
+    assert TzInfo.cache_info().currsize == 1
+    tokyo = TzInfo.parse('Asia/Tokyo')
+    assert TzInfo.parse('Asia/Tokyo') is tokyo
+    assert TzInfo.cache_info().currsize == 1
@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from timestamp import Timestamp
+from timestamp.xlate import TSXlate
+
+
+class FakeClock:
+    def __init__(self, *args):
+        self.value = datetime(*args, tzinfo=timezone.utc)
+
+    def __call__(self):
+        return self.value
+
+    def advance(self, **kwargs):
+        self.value += timedelta(**kwargs)
+
+
+@pytest.fixture
+def clock():
+    TSXlate.cache_clear()
+    yield FakeClock(2020, 5, 6, 7, 8, 9, 500_000)
+    TSXlate.cache_clear()
+
+
+@pytest.fixture
+def counted():
+    def register(frame):
+        calls = []
+
+        def handler(now, is_from):
+            calls.append(now)
+            return now.floor('minute') if is_from else now
+
+        TSXlate.register('test-rule', handler, frame=frame)
+        return calls
+
+    yield register
+    TSXlate.unregister('test-rule')
+
+
+@pytest.mark.parametrize('rule, start, end', [
+    ('now', '2020-05-06T07:08:09.500000', '2020-05-06T07:08:09.500000'),
+    ('day', '2020-05-06T00:00:00', '2020-05-06T23:59:59.999999'),
+    ('yesterday', '2020-05-05T00:00:00', '2020-05-05T23:59:59.999999'),
+    ('lastweek', '2020-04-27T00:00:00', '2020-05-03T23:59:59.999999'),
+    ('lastquarter', '2020-01-01T00:00:00', '2020-03-31T23:59:59.999999'),
+    ('30days', '2020-06-05T07:08:09.500000', '2020-06-05T07:08:09.500000'),
+    ('-2hours', '2020-05-06T05:08:09.500000', '2020-05-06T05:08:09.500000'),
+    ('bot', '2008-01-01T00:00:00', '2008-01-01T00:00:00'),
+    ('2019-01-02 03:04:05', '2019-01-02T03:04:05', '2019-01-02T03:04:05'),
+])
+def test_builtin_rules(clock, rule, start, end):
+    assert Timestamp.xlate(rule, clock=clock).isoformat() == start + '+00:00'
+    assert Timestamp.xlate(rule, is_from=False, clock=clock).isoformat() == end + '+00:00'
+
+
+def test_unknown_rule(clock):
+    with pytest.raises(ValueError):
+        Timestamp.xlate('fortnight', clock=clock)
+
+
+def test_register_and_unregister(clock, counted):
+    counted('static')
+    assert Timestamp.xlate('test-rule', clock=clock) == Timestamp(2020, 5, 6, 7, 8)
+    TSXlate.unregister('test-rule')
+    with pytest.raises(ValueError):
+        Timestamp.xlate('test-rule', clock=clock)
+
+
+def test_register_decorator_and_pattern(clock):
+    @TSXlate.register_pattern(r'^in(?P<n>\d+)m$')
+    def minutes_ahead(now, is_from, match):
+        return now.shift(minutes=int(match.group('n')))
+
+    try:
+        assert Timestamp.xlate('in5m', clock=clock).isoformat() == '2020-05-06T07:13:09.500000+00:00'
+    finally:
+        TSXlate.unregister(r'^in(?P<n>\d+)m$')
+    with pytest.raises(ValueError):
+        Timestamp.xlate('in5m', clock=clock)
+
+
+def test_register_rejects_unknown_frame():
+    with pytest.raises(ValueError):
+        TSXlate.register('test-rule', lambda now, is_from: now, frame='fortnight')
+
+
+def test_relative_rules_cached_until_next_second(clock, counted):
+    calls = counted(None)
+    first = Timestamp.xlate('test-rule', is_from=False, clock=clock)
+    clock.advance(microseconds=400_000)
+    assert Timestamp.xlate('test-rule', is_from=False, clock=clock) == first
+    assert len(calls) == 1
+
+    clock.advance(microseconds=100_000)
+    assert Timestamp.xlate('test-rule', is_from=False, clock=clock) == clock.value
+    assert len(calls) == 2
+
+
+def test_frame_rules_cached_until_boundary(clock, counted):
+    calls = counted('day')
+    Timestamp.xlate('test-rule', clock=clock)
+    clock.advance(hours=16, minutes=51)
+    Timestamp.xlate('test-rule', clock=clock)
+    assert len(calls) == 1
+
+    clock.advance(hours=1)
+    assert Timestamp.xlate('test-rule', clock=clock) == Timestamp(2020, 5, 7, 0, 59)
+    assert len(calls) == 2
+
+
+def test_cache_keys(clock, counted):
+    calls = counted('static')
+    Timestamp.xlate('test-rule', clock=clock)
+    Timestamp.xlate('test-rule', is_from=False, clock=clock)
+    Timestamp.xlate('test-rule', tz='Asia/Tokyo', clock=clock)
+    Timestamp.xlate('test-rule', tz='Asia/Tokyo', clock=clock)
+    assert len(calls) == 3
+    assert Timestamp.xlate('test-rule', tz='Asia/Tokyo', clock=clock).tz == 'Asia/Tokyo'
+
+
+def test_cache_hits_return_fresh_objects(clock):
+    first = Timestamp.xlate('day', clock=clock)
+    second = Timestamp.xlate('day', clock=clock)
+    assert first == second and first is not second
+
+
+def test_registering_clears_cache(clock, counted):
+    calls = counted('static')
+    Timestamp.xlate('test-rule', clock=clock)
+    TSXlate.register('other-rule', lambda now, is_from: now)
+    TSXlate.unregister('other-rule')
+    Timestamp.xlate('test-rule', clock=clock)
+    assert len(calls) == 2
@@ -1,6 +1,6 @@
-import re
 import sys
-import calendar
+import functools
+import operator
 from datetime import (
     date,
     datetime,
@@ -8,36 +8,36 @@ from datetime import (
 )
 
 from dateutil import tz as dtz
-from dateutil.parser import ParserError, parse as dtp
-from dateutil.relativedelta import relativedelta
 
-from . import formatter, parser, util
+from . import buckets, clocks, formatter, instrument, parser, spans, stepper, util, xlate
 
-try:
-    import bson
-except ImportError:
-    has_bson = False
-else:
-    has_bson = True
+
+def __getattr__(name):
+    if name == 'has_bson':
+        from importlib.util import find_spec
+        return find_spec('bson') is not None
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 class Timestamp:
+    __slots__ = ('_dt', '_safedt', '_safetz')
+
     _ATTRS = ["year", "month", "day", "hour", "minute", "second", "microsecond"]
     _ATTRS_PLURAL = [f"{attr}s" for attr in _ATTRS]
     _ATTR_MAP = {k: v for k, v in zip(_ATTRS_PLURAL, _ATTRS)}
-
-    _REXLATE = re.compile(r'^(?P<num>[-]?[\d]*)(?P<frame>[minute|hour|day|week|month|quarter|year]*[s]?)$')
-    _RESTAMP = re.compile(
-        r'^(?P<year>[\d]{2,4})[-/]?'
-        r'(?P<month>[\d]{1,2})[-/]?'
-        r'(?P<day>[\d]{1,2})[\sT]?'
-        r'(?P<hour>[\d]{0,2})[:]?'
-        r'(?P<minute>[\d]{0,2})[:]?'
-        r'(?P<second>[\d]{0,2})[\s\.]?'
-        r'(?P<microsecond>[\d]{0,6})[\s]?'
-        r'(?P<tzoffset>[+-]?[\d]{0,2}[:]?[\d]{0,2})[\s]?'
-        r'(?P<tzname>[\w]*[/]?[\w]*)$'
+    _SHIFTS = dict(
+        {f'{k}s': f'{k}s' for k in _ATTRS + ['week', 'quarter']},
+        **{k: f'{k}s' for k in _ATTRS + ['week', 'quarter']},
+        weekday='weekday',
     )
+    _OPERATORS = {
+        '==': operator.eq,
+        '!=': operator.ne,
+        '<': operator.lt,
+        '<=': operator.le,
+        '>': operator.gt,
+        '>=': operator.ge,
+    }
 
     def __init__(
         self,
@@ -73,37 +73,26 @@ class Timestamp:
             if not safedt:
                 raise e
 
+            instrument.count('Timestamp.__init__.safedt')
             self._dt = datetime(
                 **util.safe_date(year, month, day, hour, minute, second, microsecond),
                 tzinfo=tzinfo
             )
 
     def __add__(self, other):
-        if isinstance(other, (timedelta, relativedelta)):
-            return self.fromdatetime(self._dt + other, tzinfo=self.tzinfo)
+        if isinstance(other, timedelta) or util.is_relativedelta(other):
+            return self._wrap(self._dt + other)
         return NotImplementedError(f'not supported: {other!r}')
 
     def __eq__(self, other):
-        return self.__eval__(other, '==')
+        if isinstance(other, self.__class__):
+            return self._dt == other._dt
+        return self._compare(other, operator.eq)
 
     def __eval__(self, other, sign):
-        if sign not in ['==', '!=', '<', '<=', '>', '>=']:
+        if sign not in self._OPERATORS:
             raise NotImplementedError(f'not supported: {sign!r}')
-        elif other is None:
-            return False
-        elif isinstance(other, str):
-            other = self.__class__.get(other)
-        elif has_bson and isinstance(other, bson.ObjectId):
-            other = self.fromdatetime(other.generation_time.replace(tzinfo=None))
-
-        if self.is_date(other):
-            return eval(f'self.date {sign} other')
-        elif self.is_datetime(other):
-            if not other.tzinfo:
-                return eval(f'self.naive {sign} other')
-            return eval(f'self.datetime {sign} other')
-        elif self.is_self(other):
-            return eval(f'self.datetime {sign} other.datetime')
+        return self._compare(other, self._OPERATORS[sign])
 
     def __format__(self, fmt):
         if fmt and isinstance(fmt, str):
@@ -111,22 +100,32 @@ class Timestamp:
         return str(self)
 
     def __ge__(self, other):
-        return self.__eval__(other, '>=')
+        if isinstance(other, self.__class__):
+            return self._dt >= other._dt
+        return self._compare(other, operator.ge)
 
     def __gt__(self, other):
-        return self.__eval__(other, '>')
+        if isinstance(other, self.__class__):
+            return self._dt > other._dt
+        return self._compare(other, operator.gt)
 
     def __hash__(self):
         return self._dt.__hash__()
 
     def __le__(self, other):
-        return self.__eval__(other, '<=')
+        if isinstance(other, self.__class__):
+            return self._dt <= other._dt
+        return self._compare(other, operator.le)
 
     def __lt__(self, other):
-        return self.__eval__(other, '<')
+        if isinstance(other, self.__class__):
+            return self._dt < other._dt
+        return self._compare(other, operator.lt)
 
     def __ne__(self, other):
-        return self.__eval__(other, '!=')
+        if isinstance(other, self.__class__):
+            return self._dt != other._dt
+        return self._compare(other, operator.ne)
 
     def __radd__(self, other):
         return self.__add__(other)
@@ -169,8 +168,8 @@ class Timestamp:
         return self.isoformat()
 
     def __sub__(self, other):
-        if isinstance(other, (timedelta, relativedelta)):
-            return self.fromdatetime(self._dt - other, tzinfo=self.tzinfo)
+        if isinstance(other, timedelta) or util.is_relativedelta(other):
+            return self._wrap(self._dt - other)
         elif self.is_self(other):
             return self._dt - other._dt
         elif self.is_date(other):
@@ -262,7 +261,8 @@ class Timestamp:
 
     @property
     def timegm(self):
-        return calendar.timegm(self.timetuple)
+        from calendar import timegm
+        return timegm(self.timetuple)
 
     @property
     def timestamp(self):
@@ -369,7 +369,7 @@ class Timestamp:
         return self.span(frame)[1]
 
     def copy(self):
-        return self.fromdatetime(self._dt, tzinfo=self.tzinfo)
+        return self._wrap(self._dt)
 
     def fileformat(self, include_time=False):
         if include_time:
@@ -377,16 +377,21 @@ class Timestamp:
         return self.format('YYYYMMDD')
 
     def floor(self, frame):
-        return self.span(frame)[0]
+        return self._wrap(spans.SpanEngine.floor(self._dt, self._get_frames(frame)[0]))
 
     def format(self, fmt='YYYY-MM-DD HH:mm:ssZZ'):
         return formatter.Formatter(self, fmt)
 
-    def humanize(self):
+    def humanize(self, now=None):
         def pluralize(f, i):
             return f'{f}' if i == 1 else f'{f}s'
 
-        now = self.now(self.tzinfo)
+        if now is None:
+            now = self.now(self.tzinfo)
+        else:
+            now = now if self.is_self(now) else self.get(now)
+            if now.tzinfo is not self.tzinfo:
+                now = now.to(self.tzinfo)
         if now > self:
             s = int((now - self).total_seconds())
             t = '{} {} ago'
@@ -450,28 +455,33 @@ class Timestamp:
             elif k != 'tzinfo' or k in ('week', 'weeks', 'quarter', 'quarters'):
                 raise NotImplementedError(f'not supportd: {k!r}')
         kw['tzinfo'] = self.tzparser(kwargs.get('tzinfo', self.tzinfo))
-        return self.fromdatetime(self._dt.replace(**kw))
+        return self._wrap(self._dt.replace(**kw))
 
     def shift(self, **kwargs):
         relatives = {}
-        addattrs = ['weeks', 'quarters', 'weekday']
         for k, v in kwargs.items():
-            if k in self._ATTR_MAP or k in addattrs:
-                relatives[k] = v
-            elif k in self._ATTRS + ['week', 'quarter']:
-                relatives[f'{k}s'] = v
-            else:
-                supported = ', '.join(self._ATTRS_PLURAL + addattrs)
+            relative = self._SHIFTS.get(k)
+            if relative is None:
+                supported = ', '.join(self._ATTRS_PLURAL + ['weeks', 'quarters', 'weekday'])
                 raise ValueError(f'timeframe not supported: {k!r} not in {supported}')
+            relatives[relative] = v
 
-        relatives.setdefault('months', 0)
-        relatives['months'] += relatives.pop('quarters', 0) * 3
+        if 'weekday' in relatives:
+            return self._shift_relative(relatives)
+        for v in relatives.values():
+            if v.__class__ is not int:
+                return self._shift_relative(relatives)
 
-        current = self._dt + relativedelta(**relatives)
-        if not dtz.datetime_exists(current):
-            current = dtz.resolve_imaginary(current)
+        current = self._dt
+        months = relatives.pop('years', 0) * 12 + relatives.pop('months', 0) + relatives.pop('quarters', 0) * 3
+        if months:
+            current = util.add_months(current, months)
+        current += timedelta(**relatives)
 
-        return self.fromdatetime(current, tzinfo=self.tzinfo)
+        resolved = parser.TzInfo.resolve(current)
+        if resolved is not current:
+            instrument.count('Timestamp.shift.imaginary')
+        return self._wrap(resolved)
 
     def smartformat(self, d='-', s=' ', t=':', tz=False, fname=False):
         if fname:
@@ -486,45 +496,15 @@ class Timestamp:
 
     def span(self, frame, count=1, bounds="[)", exact=False):
         util.validate_bounds(bounds)
-        absolute, relative, steps = self._get_frames(frame)
-
-        if absolute == 'week':
-            attr = 'day'
-        elif absolute == 'quarter':
-            attr = 'month'
-        else:
-            attr = absolute
-
-        floor = self
-        if not exact:
-            index = self._ATTRS.index(attr)
-            frames = self._ATTRS[: index + 1]
-            values = [getattr(self, f) for f in frames]
-
-            for _ in range(3 - len(values)):
-                values.append(1)
-            floor = self.__class__(*values, tzinfo=self.tzinfo)
-
-            if absolute == 'week':
-                floor = floor.shift(days=-(self.isoweekday - 1))
-            elif absolute == 'quarter':
-                floor = floor.shift(months=-((self.month - 1) % 3))
-
-        ceil = floor.shift(**{relative: count * steps})
-
-        if bounds[0] == '(':
-            floor = floor.shift(microseconds=1)
-        if bounds[1] == ')':
-            ceil = ceil.shift(microseconds=-1)
-
-        return floor, ceil
+        floor, ceil = spans.SpanEngine.span(self._dt, self._get_frames(frame), count, bounds, exact)
+        return self._wrap(floor), self._wrap(ceil)
 
     def strftime(self, fmt):
         return self._dt.strftime(fmt)
 
     def to(self, tz, **kwargs):
         tzinfo = self.tzparser(tz, **kwargs)
-        return self.fromdatetime(self.astimezone(tzinfo), **kwargs)
+        return self._wrap(self._dt.astimezone(tzinfo), **kwargs)
 
     def to_utc(self):
         return self.to('UTC')
@@ -533,6 +513,23 @@ class Timestamp:
     # Class Methods #
     #################
 
+    @classmethod
+    def bucketize(cls, items, frame, count=1, tz=None, origin=None, epoch=False, stream=False, numpy=False):
+        bucketizer = buckets.Bucketizer(cls, frame, count=count, tz=tz, origin=origin)
+        if numpy:
+            return bucketizer.array(items)
+        keys = bucketizer.keys(items, epoch=epoch)
+        return keys if stream else list(keys)
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def compile_strptime(cls, fmt, tokens=None):
+        return parser.StrptimePlan(fmt, cls, tokens=tokens)
+
+    @classmethod
+    def format_many(cls, items, fmt='YYYY-MM-DD HH:mm:ssZZ', stream=False):
+        return formatter.Formatter.format_many(items, fmt, stream=stream)
+
     @classmethod
     def fromdate(cls, d, tzinfo=None, **kwargs):
         if not cls.is_date(d):
@@ -549,6 +546,8 @@ class Timestamp:
     def fromdatetime(cls, dt, tzinfo=None, **kwargs):
         if not cls.is_datetime(dt):
             raise ValueError(f'invalid datetime: {dt!r}')
+        if tzinfo is None and dt.__class__ is datetime and dt.tzinfo.__class__ in parser.TzInfo._RESOLVED:
+            return cls._wrap(dt, **kwargs)
         return cls(
             dt.year,
             dt.month,
@@ -572,7 +571,16 @@ class Timestamp:
             raise ValueError(f'invalid timestamp: {value!r}')
         timestamp = util.validate_timestamp(float(value))
         tzinfo = cls.tzparser(tzinfo, **kwargs)
-        return cls.fromdatetime(datetime.fromtimestamp(timestamp, tzinfo), **kwargs)
+        return cls._wrap(datetime.fromtimestamp(timestamp, tzinfo), **kwargs)
+
+    @classmethod
+    def fromtimestamps(cls, values, unit='auto', tz=None, compact=False):
+        tzinfo = cls.tzparser(tz)
+        values = util.epoch_us_many(values, unit)
+        if compact:
+            from .array import TimestampArray
+            return TimestampArray(values, tzinfo)
+        return [cls._wrap(dt) for dt in parser.TzInfo.fromutc_many(tzinfo, values)]
 
     @classmethod
     def get(cls, d, tzinfo=None, default=None, **kwargs):
@@ -590,12 +598,30 @@ class Timestamp:
             return cls.fromtimestamp(d, tzinfo=tzinfo, **kwargs)
         else:
             try:
-                return cls.get(dtp(d), tzinfo=tzinfo)
-            except (TypeError, ParserError):
+                return cls.get(parser.IsoParser.parse(d), tzinfo=tzinfo)
+            except (TypeError, parser.ParserError):
+                instrument.count('Timestamp.get.default')
                 if default == 'now':
                     return cls.now(tzinfo=tzinfo)
             return default
 
+    @classmethod
+    def humanize_many(cls, items, now=None):
+        if now is None:
+            now = cls.now()
+        elif not cls.is_self(now):
+            now = cls.get(now)
+        zones = {}
+        results = []
+        for item in items:
+            item = item if cls.is_self(item) else cls.get(item)
+            tzinfo = item.tzinfo
+            found = zones.get(id(tzinfo))
+            if found is None or found[0] is not tzinfo:
+                found = zones[id(tzinfo)] = (tzinfo, now.to(tzinfo))
+            results.append(item.humanize(now=found[1]))
+        return results
+
     @classmethod
     def interval(cls, frame, start, end, interval=1, tz=None, bounds='[)', exact=False):
         interval = int(interval)
@@ -627,46 +653,29 @@ class Timestamp:
         return isinstance(d, cls)
 
     @classmethod
-    def now(cls, tzinfo=None, **kwargs):
+    def now(cls, tzinfo=None, clock=None, **kwargs):
         tzinfo = cls.tzparser(tzinfo)
-        return cls.fromdatetime(datetime.now(tzinfo), **kwargs)
+        return cls._wrap(clocks.now(tzinfo, clock), **kwargs)
 
     @classmethod
     def range(cls, frame, start='now', end=None, tz=None, limit=None):  # noqa
-        _, relative, steps = cls._get_frames(frame)
-        if isinstance(start, str):
-            tzinfo = cls.tzparser(tz)
-        else:
-            tzinfo = cls.tzparser(start.tzinfo if tz is None else tz)
-
-        def getiteration(e, lim):
-            if e is None:
-                if limit is None:
-                    raise ValueError('either `end` or `limit` params required')
-                return datetime.max, limit
-            elif lim is None:
-                return end, sys.maxsize
-            return e, lim
-
-        start = cls.get(start, tzinfo=tzinfo)
-        end, limit = getiteration(end, limit)
-        end = cls.get(end, tzinfo=tzinfo)
+        steps, end, limit = cls._range_steps(frame, start, end, tz, limit)
 
-        current = start.copy()
-        dayclipped = False
         i = 0
-
-        while current <= end and i < limit:
+        for current in steps:
+            if current > end or i >= limit:
+                return
             i += 1
-            yield current
-
-            current = current.shift(**{relative: steps})
+            yield cls._wrap(current)
 
-            if frame in ['month', 'quarter', 'year'] and current.day < start.day:
-                dayclipped = True
+    @classmethod
+    def rangeview(cls, frame, start='now', end=None, tz=None, limit=None):
+        steps, end, limit = cls._range_steps(frame, start, end, tz, limit)
+        return stepper.TimestampRange.create(cls, steps, end, limit)
 
-            if dayclipped and current.day != calendar.monthrange(current.year, current.month)[1]:
-                current = current.replace(day=start.day)
+    @classmethod
+    def parse_many(cls, iterable, tz=None, fmt=None, errors='raise'):
+        return parser.BulkParser(cls, tz=tz, fmt=fmt).parse(iterable, errors=errors)
 
     @classmethod
     def spanrange(cls, frame, start, end, tz=None, limit=None, bounds='[)', exact=False):
@@ -684,17 +693,16 @@ class Timestamp:
                 if ceil > end:
                     ceil = end
                     if bounds[1] == ')':
-                        ceil += relativedelta(microseconds=-1)
+                        ceil -= util.MICROSECOND
                 if floor == end:
                     break
-                elif floor + relativedelta(microseconds=-1) == end:
+                elif floor - util.MICROSECOND == end:
                     break
                 yield floor, ceil
 
     @classmethod
     def strptime(cls, string, fmt, tzinfo=None):
-        dt = datetime.strptime(string, fmt)
-        return cls.fromdatetime(dt, tzinfo=tzinfo)
+        return cls.compile_strptime(fmt, tokens=False)(string, tzinfo=tzinfo)
 
     @classmethod
     def tzparser(cls, tz, **kwargs):
@@ -713,98 +721,8 @@ class Timestamp:
         return cls.fromdatetime(datetime.utcnow())
 
     @classmethod
-    def xlate(cls, rule, is_from=True, default=None):
-        now = cls.now()
-        if not default:
-            default = now
-
-        if rule == 'default':
-            if is_from:
-                return now.shift(days=-32)
-            return now
-
-        elif rule in ['current', 'now']:
-            return now
-
-        elif rule == 'hour':
-            if is_from:
-                return now.floor('hour')
-            return now.ceil('hour')
-
-        elif rule == 'day':
-            if is_from:
-                return now.floor('day')
-            return now.ceil('day')
-
-        elif rule == 'week':
-            if is_from:
-                return now.floor('week')
-            return now.ceil('week')
-
-        elif rule == 'month':
-            if is_from:
-                return now.floor('month')
-            return now.ceil('month')
-
-        elif rule == 'lasthour':
-            now = now.shift(hour=-1)
-            if is_from:
-                return now.floor('hour')
-            return now.ceil('hour')
-
-        elif rule in ['yesterday', 'lastday']:
-            now = now.shift(days=-1)
-            if is_from:
-                return now.floor('day')
-            return now.ceil('day')
-
-        elif rule == 'lastweek':
-            now = now.shift(weeks=-1)
-            if is_from:
-                return now.floor('week')
-            return now.ceil('week')
-
-        elif rule == 'lastmonth':
-            now = now.shift(months=-1)
-            if is_from:
-                return now.floor('month')
-            return now.ceil('month')
-
-        elif rule == 'lastquarter':
-            now = now.floor('quarter').shift(quarter=-1)
-            if is_from:
-                return now.floor('quarter')
-            return now.ceil('quarter')
-
-        elif rule == 'lastyear':
-            now = now.shift(year=-1)
-            if is_from:
-                return now.floor('year')
-            return now.ceil('year')
-
-        elif rule == 'bot':
-            return now.replace(year=2008).floor('year')
-
-        match = cls._RESTAMP.match(rule)
-        if match:
-            result = {}
-            m = match.groupdict()
-            for k, v in m.items():
-                if k in cls._ATTRS:
-                    if v:
-                        result[k] = int(v)
-                    else:
-                        result[k] = 0
-            result['tzinfo'] = m['tzname'] or m['tzoffset'] or None
-            dt = cls(**result)
-            return dt.to('UTC') if dt else None
-
-        match = cls._REXLATE.match(rule)
-        if match:
-            m = match.groupdict()
-            return now.shift(**{m['frame']: int(m['num'])})
-
-        raise ValueError(f'not supported: {rule!r}')
+    def xlate(cls, rule, is_from=True, default=None, tz=None, clock=None):
+        return xlate.TSXlate.xlate(cls, rule, is_from=is_from, tz=tz, clock=clock)
 
     ##################
     # Static Methods #
@@ -844,6 +762,86 @@ class Timestamp:
     # Private Methods #
     ###################
 
+    @classmethod
+    def _range_steps(cls, frame, start, end, tz, limit):
+        _, relative, steps = cls._get_frames(frame)
+        if isinstance(start, str):
+            tzinfo = cls.tzparser(tz)
+        else:
+            tzinfo = cls.tzparser(start.tzinfo if tz is None else tz)
+
+        def getiteration(e, lim):
+            if e is None:
+                if limit is None:
+                    raise ValueError('either `end` or `limit` params required')
+                return datetime.max, limit
+            elif lim is None:
+                return end, sys.maxsize
+            return e, lim
+
+        start = cls.get(start, tzinfo=tzinfo)
+        end, limit = getiteration(end, limit)
+        end = cls.get(end, tzinfo=tzinfo)
+        return stepper.Stepper(start.datetime, frame, relative, steps), end.datetime, limit
+
+    def _shift_relative(self, relatives):
+        from dateutil.relativedelta import relativedelta
+
+        relatives.setdefault('months', 0)
+        relatives['months'] += relatives.pop('quarters', 0) * 3
+
+        current = self._dt + relativedelta(**relatives)
+        if not dtz.datetime_exists(current):
+            instrument.count('Timestamp.shift.imaginary')
+            current = dtz.resolve_imaginary(current)
+
+        return self._wrap(current)
+
+    @classmethod
+    def _wrap(cls, dt, safedt=False, safetz=False, **kwargs):
+        # fold is dropped, as it is when a datetime is rebuilt field by field
+        if dt.fold:
+            dt = dt.replace(fold=0)
+        obj = object.__new__(cls)
+        obj._dt = dt
+        obj._safedt = safedt
+        obj._safetz = safetz
+        return obj
+
+    def _compare(self, other, op):
+        if other is None:
+            return False
+        elif isinstance(other, str):
+            other = self._getstr(other)
+        elif util.is_objectid(other):
+            other = self.fromdatetime(other.generation_time.replace(tzinfo=None))
+
+        if isinstance(other, datetime):
+            if not other.tzinfo:
+                return op(self.naive, other)
+            return op(self._dt, other)
+        elif isinstance(other, date):
+            return op(self.date, other)
+        elif isinstance(other, self.__class__):
+            return op(self._dt, other._dt)
+
+    @classmethod
+    def _getstr(cls, string):
+        found = cls._getiso(string)
+        return cls.get(string) if found is None else found
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _getiso(cls, string):
+        if cls.is_timestamp(string):
+            return cls.get(string)
+        dt = parser.IsoParser.fromisoformat(string)
+        if dt is None:
+            dt = parser.IsoParser.match(string)
+        if dt is None:
+            return None
+        return cls.get(dt, tzinfo=cls.tzparser(None))
+
     @classmethod
     def _get_frames(cls, attr):
         if attr in cls._ATTRS:
@@ -856,3 +854,10 @@ class Timestamp:
             return 'quarter', 'months', 3
         supported = ', '.join(f'{a}(s)' for a in cls._ATTRS + ['week', 'quarter'])
         raise ValueError(f'timeframe not supported: {attr!r} not in {supported}')
+
+
+def stats(reset=False):
+    snapshot = instrument.snapshot()
+    if reset:
+        instrument.reset()
+    return snapshot
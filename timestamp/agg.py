@@ -0,0 +1,171 @@
+from bisect import insort
+from collections import deque, namedtuple
+from datetime import timedelta
+
+from . import buckets, parser, util
+
+
+class Window(namedtuple('Window', 'start end count total min max')):
+    __slots__ = ()
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+
+class WindowCounter:
+    def __init__(self, frame, tz=None, size=1, sliding=False, lateness=0, retention=1024, empty=False):
+        from . import Timestamp
+
+        for name, value, low in (('size', size, 1), ('retention', retention, 1)):
+            if isinstance(value, bool) or not isinstance(value, int) or value < low:
+                raise ValueError(f'invalid {name}: {value!r}')
+        if not isinstance(lateness, timedelta):
+            lateness = timedelta(seconds=lateness)
+        if lateness < timedelta(0):
+            raise ValueError(f'invalid lateness: {lateness!r}')
+
+        self.frame = frame
+        self.size = size
+        self.sliding = sliding
+        self.lateness = lateness
+        self.retention = retention
+        self.empty = empty
+        self.dropped = 0
+        self.evicted = 0
+
+        self._factory = Timestamp
+        self._buckets = buckets.Bucketizer(Timestamp, frame, count=1 if sliding else size, tz=tz)
+        self._lateness = lateness // util.MICROSECOND
+        self._panes = {}
+        self._keys = []
+        self._closed = None
+        self._history = deque(maxlen=size if sliding else 1)
+        self._latest = None
+        self._watermark = None
+
+    def __len__(self):
+        return len(self._panes)
+
+    def __repr__(self):
+        return '{}({!r}, tz={!r}, size={!r}, sliding={!r}, open={})'.format(
+            self.__class__.__name__, self.frame, self.tz, self.size, self.sliding, len(self)
+        )
+
+    ##############
+    # Properties #
+    ##############
+
+    @property
+    def tz(self):
+        return parser.TzInfo.extract(self._buckets.tzinfo)
+
+    @property
+    def tzinfo(self):
+        return self._buckets.tzinfo
+
+    @property
+    def watermark(self):
+        if self._latest is None:
+            return None
+        return self._factory._wrap(self._latest)
+
+    ####################
+    # Instance Methods #
+    ####################
+
+    def add(self, timestamp, value=1):
+        dt = self._buckets.convert(timestamp)
+        floor, _, upper, key = self._buckets.locate(dt)
+        if self._closed is not None and key <= self._closed:
+            self.dropped += 1
+            return False
+
+        pane = self._panes.get(key)
+        if pane is None:
+            deadline = None if upper is None else self._epoch(upper) + self._lateness
+            pane = self._panes[key] = [floor, upper, deadline, 0, 0, None, None]
+            insort(self._keys, key)
+        pane[3] += 1
+        pane[4] += value
+        if pane[5] is None or value < pane[5]:
+            pane[5] = value
+        if pane[6] is None or value > pane[6]:
+            pane[6] = value
+
+        if self._latest is None or dt > self._latest:
+            self._latest = dt
+            self._watermark = self._epoch(dt)
+        return True
+
+    def completed(self):
+        keys = self._keys
+        panes = self._panes
+        while keys:
+            pane = panes[keys[0]]
+            if len(keys) > self.retention:
+                self.evicted += 1
+            elif pane[2] is None or pane[2] > self._watermark:
+                break
+            yield from self._complete(keys[0])
+
+    def flush(self):
+        while self._keys:
+            yield from self._complete(self._keys[0])
+
+    def update(self, pairs):
+        for timestamp, value in pairs:
+            if self.add(timestamp, value):
+                yield from self.completed()
+
+    ###################
+    # Private Methods #
+    ###################
+
+    def _complete(self, key):
+        pane = self._panes.pop(self._keys.pop(0))
+        self._closed = key
+        if self._history and (self.empty or self.sliding):
+            yield from self._fill(pane[0])
+        yield from self._emit(pane[0], pane[1], pane[3:])
+
+    def _emit(self, floor, upper, stats):
+        self._history.append((floor, upper, stats))
+        if not self.sliding:
+            if stats[0] or self.empty:
+                yield self._window(floor, upper, stats)
+            return
+
+        history = self._history
+        count = sum(h[2][0] for h in history)
+        if not count and not self.empty:
+            return
+        stats = (
+            count,
+            sum(h[2][1] for h in history if h[2][0]),
+            min((h[2][2] for h in history if h[2][0]), default=None),
+            max((h[2][3] for h in history if h[2][0]), default=None),
+        )
+        yield self._window(history[0][0], upper, stats)
+
+    def _fill(self, until):
+        steps = 0
+        upper = self._history[-1][1]
+        while upper is not None and upper < until:
+            if not self.empty and steps >= self.size - 1:
+                self._history.clear()
+                return
+            floor, _, upper = self._buckets.bounds(upper)
+            if floor >= until:
+                return
+            yield from self._emit(floor, upper, (0, 0, None, None))
+            steps += 1
+
+    def _window(self, floor, upper, stats):
+        factory = self._factory
+        end = upper if upper is None else parser.TzInfo.resolve(upper - util.MICROSECOND)
+        return Window(factory._wrap(floor), None if end is None else factory._wrap(end), *stats)
+
+    @staticmethod
+    def _epoch(dt):
+        return (dt.replace(tzinfo=None) - util.EPOCH_NAIVE - parser.TzInfo.utcoffset(dt)) // util.MICROSECOND
@@ -0,0 +1,249 @@
+from datetime import datetime
+
+from . import Timestamp, formatter, parser, util
+
+try:
+    import numpy as np
+except ImportError:
+    has_numpy = False
+else:
+    has_numpy = True
+
+SECOND = 1_000_000
+DAY = 86_400 * SECOND
+
+_FIXED = {
+    'microsecond': 1,
+    'second': SECOND,
+    'minute': 60 * SECOND,
+    'hour': 3_600 * SECOND,
+    'day': DAY,
+    'week': 7 * DAY,
+}
+
+
+class _Zone:
+    def __init__(self, tzinfo, lo, hi):
+        first = max(util.MIN_YEAR + 1, util.from_epoch_us(lo).year - 1)
+        last = min(util.MAX_YEAR - 1, util.from_epoch_us(hi).year + 1)
+        transitions = [
+            t for year in range(first, last + 1)
+            for t in parser.TzInfo.transitions(tzinfo, year)
+        ]
+        if transitions:
+            base = transitions[0][1]
+        else:
+            base = parser.TzInfo.offset(tzinfo, (datetime(first, 1, 1) - util.EPOCH_NAIVE).total_seconds())
+
+        self.utc = np.array([t * SECOND for t, _, _ in transitions], dtype='int64')
+        self.before = np.array([b // util.MICROSECOND for _, b, _ in transitions], dtype='int64')
+        self.offsets = np.array(
+            [base // util.MICROSECOND] + [a // util.MICROSECOND for _, _, a in transitions],
+            dtype='int64',
+        )
+        self.wall = self.utc + self.before
+        self.gap = np.maximum(self.offsets[1:] - self.before, 0)
+
+    def to_wall(self, values):
+        return values + self.offsets[np.searchsorted(self.utc, values, side='right')]
+
+    def to_utc(self, wall):
+        return wall - self.offsets[np.searchsorted(self.wall, wall, side='right')]
+
+    def resolve(self, wall):
+        index = np.searchsorted(self.wall, wall, side='right') - 1
+        if not len(self.gap):
+            return wall
+        clipped = np.maximum(index, 0)
+        gap = self.gap[clipped]
+        imaginary = (index >= 0) & (wall < self.wall[clipped] + gap)
+        return np.where(imaginary, wall + gap, wall)
+
+
+class TimestampArray:
+    def __init__(self, values, tz=None):
+        if not has_numpy:
+            raise ImportError('numpy is required for TimestampArray')
+        self._values = np.asarray(values, dtype='int64')
+        self._tzinfo = parser.TzInfo.parse(tz)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            value = self._values[index]
+            return self._timestamp(int(self._zone(value, value).to_wall(np.array([value]))[0]))
+        return self.__class__(self._values[index], self._tzinfo)
+
+    def __iter__(self):
+        for value in self._wall():
+            yield self._timestamp(int(value))
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return '{}(<{} values>, tz={!r})'.format(self.__class__.__name__, len(self), self.tz)
+
+    ##############
+    # Properties #
+    ##############
+
+    @property
+    def day(self):
+        wall = self._wall().astype('M8[us]')
+        return (wall.astype('M8[D]') - wall.astype('M8[M]').astype('M8[D]')).astype('int64') + 1
+
+    @property
+    def month(self):
+        return self._wall().astype('M8[us]').astype('M8[M]').astype('int64') % 12 + 1
+
+    @property
+    def quarter(self):
+        return (self.month - 1) // 3 + 1
+
+    @property
+    def tz(self):
+        return parser.TzInfo.extract(self._tzinfo)
+
+    @property
+    def tzinfo(self):
+        return self._tzinfo
+
+    @property
+    def values(self):
+        return self._values
+
+    @property
+    def week(self):
+        days = self._wall() // DAY
+        thursday = days - (days + 3) % 7 + 3
+        year = thursday.astype('M8[D]').astype('M8[Y]').astype('M8[D]').astype('int64')
+        return (thursday - year) // 7 + 1
+
+    @property
+    def year(self):
+        return self._wall().astype('M8[us]').astype('M8[Y]').astype('int64') + 1970
+
+    ####################
+    # Instance Methods #
+    ####################
+
+    def ceil(self, frame):
+        return self.span(frame)[1]
+
+    def floor(self, frame):
+        return self.span(frame)[0]
+
+    def format(self, fmt='YYYY-MM-DD HH:mm:ssZZ'):
+        tzinfo = self._tzinfo
+        return formatter.Formatter.format_many(
+            (dt.replace(tzinfo=tzinfo) for dt in self._wall().astype('M8[us]').tolist()),
+            fmt,
+        )
+
+    def isbetween(self, start, end, bounds='()'):
+        util.validate_bounds(bounds)
+        for value in (start, end):
+            if not Timestamp.is_convertable(value):
+                raise ValueError(f'not DateTool convertable: {value!r}')
+        start = util.epoch_us(Timestamp.get(start).datetime)
+        end = util.epoch_us(Timestamp.get(end).datetime)
+
+        values = self._values
+        lower = values >= start if bounds[0] == '[' else values > start
+        upper = values <= end if bounds[1] == ']' else values < end
+        return lower & upper
+
+    def shift(self, **kwargs):
+        delta = 0
+        for k, v in kwargs.items():
+            frame = k[:-1] if k.endswith('s') else k
+            if frame not in _FIXED:
+                supported = ', '.join(f'{f}s' for f in _FIXED)
+                raise ValueError(f'timeframe not supported: {k!r} not in {supported}')
+            delta += int(v * _FIXED[frame])
+
+        if not len(self._values):
+            return self.__class__(self._values, self._tzinfo)
+        zone = self._zone(self._values.min() - abs(delta) - DAY, self._values.max() + abs(delta) + DAY)
+        wall = zone.resolve(zone.to_wall(self._values) + delta)
+        return self.__class__(zone.to_utc(wall), self._tzinfo)
+
+    def span(self, frame, count=1, bounds='[)'):
+        util.validate_bounds(bounds)
+        absolute, _, _ = Timestamp._get_frames(frame)
+        if not len(self._values):
+            return self.__class__(self._values, self._tzinfo), self.__class__(self._values, self._tzinfo)
+
+        wall = self._wall()
+        if absolute == 'week':
+            days = wall // DAY
+            floors = (days - (days + 3) % 7) * DAY
+            lower, upper = self._span_scalar(floors, frame, count, bounds)
+        elif absolute in _FIXED:
+            step = _FIXED[absolute]
+            floors = wall - wall % step
+            zone = self._zone(floors.min() - DAY, floors.max() + count * step + DAY)
+            lower, upper = self._span_fixed(zone, floors, count * step, bounds)
+            imaginary = zone.resolve(floors) != floors
+            if imaginary.any():
+                lower[imaginary], upper[imaginary] = self._span_scalar(floors[imaginary], frame, count, bounds)
+        else:
+            months = wall.astype('M8[us]').astype('M8[M]').astype('int64')
+            if absolute == 'quarter':
+                months -= months % 3
+            elif absolute == 'year':
+                months -= months % 12
+            floors = months.astype('M8[M]').astype('M8[us]').astype('int64')
+            lower, upper = self._span_scalar(floors, frame, count, bounds)
+
+        return self.__class__(lower, self._tzinfo), self.__class__(upper, self._tzinfo)
+
+    def to(self, tz):
+        return self.__class__(self._values, tz)
+
+    def to_utc(self):
+        return self.to('UTC')
+
+    #################
+    # Class Methods #
+    #################
+
+    @classmethod
+    def fromitems(cls, items, tz=None):
+        items = [i if Timestamp.is_self(i) else Timestamp.get(i) for i in items]
+        if tz is None and items:
+            tz = items[0].tzinfo
+        return cls([util.epoch_us(i.datetime) for i in items], tz)
+
+    ###################
+    # Private Methods #
+    ###################
+
+    def _span_fixed(self, zone, floors, step, bounds):
+        ceils = zone.resolve(floors + step)
+        if bounds[0] == '(':
+            floors = zone.resolve(floors + 1)
+        if bounds[1] == ')':
+            ceils = zone.resolve(ceils - 1)
+        return zone.to_utc(floors), zone.to_utc(ceils)
+
+    def _span_scalar(self, floors, frame, count, bounds):
+        unique, inverse = np.unique(floors, return_inverse=True)
+        lower = np.empty(len(unique), dtype='int64')
+        upper = np.empty(len(unique), dtype='int64')
+        for i, value in enumerate(unique.tolist()):
+            floor, ceil = self._timestamp(value).span(frame, count=count, bounds=bounds)
+            lower[i] = util.epoch_us(floor.datetime)
+            upper[i] = util.epoch_us(ceil.datetime)
+        return lower[inverse], upper[inverse]
+
+    def _timestamp(self, wall):
+        return Timestamp._wrap(util.from_epoch_us(wall).replace(tzinfo=self._tzinfo))
+
+    def _wall(self):
+        if not len(self._values):
+            return self._values
+        return self._zone(self._values.min(), self._values.max()).to_wall(self._values)
+
+    def _zone(self, lo, hi):
+        return _Zone(self._tzinfo, int(lo), int(hi))
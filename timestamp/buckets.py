@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta
+
+from . import parser, spans, util
+
+
+class Bucketizer:
+    _INTERNED_SIZE = 256
+
+    def __init__(self, factory, frame, count=1, tz=None, origin=None):
+        if isinstance(count, bool) or not isinstance(count, int) or count < 1:
+            raise ValueError(f'invalid count: {count!r}')
+        absolute, relative, steps = factory._get_frames(frame)
+        self.factory = factory
+        self.frame = frame
+        self.count = count
+        self.tzinfo = factory.tzparser(tz)
+        self._absolute = absolute
+        self._relative = relative
+        self._amount = count * steps
+
+        if relative in ('months', 'years'):
+            self._months = self._amount * 12 if relative == 'years' else self._amount
+            self._width = None
+        else:
+            self._months = None
+            self._width = timedelta(**{relative: self._amount})
+
+        if origin is None and count == 1:
+            self.origin = None
+        elif origin is None:
+            self.origin = spans.SpanEngine.floor(datetime(1970, 1, 1, tzinfo=self.tzinfo), absolute)
+        else:
+            self.origin = factory.get(origin, tzinfo=self.tzinfo).to(self.tzinfo).datetime
+        self._origin = None if self.origin is None else self.origin.replace(tzinfo=None)
+        self._last = None
+
+    def __repr__(self):
+        return '{}({!r}, count={!r}, tz={!r})'.format(
+            self.__class__.__name__, self.frame, self.count, parser.TzInfo.extract(self.tzinfo)
+        )
+
+    def array(self, values, unit='auto'):
+        from .array import TimestampArray, np
+
+        values = np.asarray(values)
+        if values.dtype.kind == 'M':
+            values = values.astype('M8[us]').astype('int64')
+        else:
+            values = np.asarray(util.epoch_us_many(values, unit), dtype='int64')
+        if self.origin is None:
+            return TimestampArray(values, self.tzinfo).floor(self.frame).values
+        return np.fromiter(self.keys(values.tolist(), epoch=True, micros=True), dtype='int64', count=len(values))
+
+    def bounds(self, dt):
+        if self._origin is None:
+            floor = spans.SpanEngine.floor(dt, self._absolute)
+            lower = parser.TzInfo.resolve(floor)
+            try:
+                upper = spans.SpanEngine.ceil(floor, self._relative, self._amount)
+            except (OverflowError, ValueError):
+                upper = None
+            return floor, lower, upper
+
+        start, following = self._aligned(dt.replace(tzinfo=None))
+        floor = lower = parser.TzInfo.resolve(start.replace(tzinfo=self.tzinfo))
+        try:
+            upper = parser.TzInfo.resolve(following().replace(tzinfo=self.tzinfo))
+        except (OverflowError, ValueError):
+            upper = None
+        return floor, lower, upper
+
+    def convert(self, item):
+        factory = self.factory
+        if factory.is_self(item):
+            dt = item._dt
+        elif isinstance(item, datetime) and item.tzinfo is not None:
+            dt = item
+        elif item.__class__ in (int, float):
+            us = util.epoch_us_many((item,))[0]
+            return (util.EPOCH + timedelta(microseconds=us)).astimezone(self.tzinfo)
+        else:
+            value = factory.get(item, tzinfo=self.tzinfo)
+            if value is None:
+                raise ValueError(f'invalid timestamp: {item!r}')
+            dt = value._dt
+
+        if dt.tzinfo is not self.tzinfo:
+            dt = dt.astimezone(self.tzinfo)
+        return dt
+
+    def floor(self, item):
+        return self.factory._wrap(self.bounds(self.convert(item))[0])
+
+    def keys(self, items, epoch=False, micros=False):
+        tzinfo = self.tzinfo
+        interned = {}
+        lower = upper = lo = hi = key = None
+
+        for item in items:
+            if micros or item.__class__ in (int, float):
+                us = item if micros else util.epoch_us_many((item,))[0]
+                if lo is not None and lo <= us < hi:
+                    yield key
+                    continue
+                dt = (util.EPOCH + timedelta(microseconds=us)).astimezone(tzinfo)
+            else:
+                dt = self.convert(item)
+                if lower is not None and lower <= dt < upper:
+                    yield key
+                    continue
+
+            floor, lower, upper = self.bounds(dt)
+            lo = util.epoch_us(lower)
+            hi = lo if upper is None else util.epoch_us(upper)
+            if upper is None:
+                lower = None
+
+            value = util.epoch_us(floor)
+            if epoch:
+                key = value
+            else:
+                key = interned.get(value)
+                if key is None:
+                    if len(interned) >= self._INTERNED_SIZE:
+                        interned.clear()
+                    key = interned[value] = self.factory._wrap(floor)
+            yield key
+
+    def locate(self, dt):
+        last = self._last
+        if last is not None and last[1] <= dt < last[2]:
+            return last
+
+        floor, lower, upper = self.bounds(dt)
+        located = (floor, lower, upper, util.epoch_us(floor))
+        if upper is not None:
+            self._last = located
+        return located
+
+    ###################
+    # Private Methods #
+    ###################
+
+    def _aligned(self, naive):
+        origin = self._origin
+        if self._width is not None:
+            width = self._width
+            start = origin + (naive - origin) // width * width
+            return start, lambda: start + width
+
+        step = self._months
+        index = ((naive.year - origin.year) * 12 + naive.month - origin.month) // step
+        start = util.add_months(origin, index * step)
+        if start > naive:
+            index -= 1
+            start = util.add_months(origin, index * step)
+        return start, lambda: util.add_months(origin, (index + 1) * step)
@@ -0,0 +1,90 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+
+
+class Clock(ABC):
+    @abstractmethod
+    def __call__(self):
+        pass
+
+    def now(self, tzinfo):
+        return self().astimezone(tzinfo)
+
+
+class SystemClock(Clock):
+    def __call__(self):
+        return datetime.now(timezone.utc)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}()'
+
+    def now(self, tzinfo):
+        return datetime.now(tzinfo)
+
+
+class CoarseClock(Clock):
+    def __init__(self, resolution=10, anchor=60):
+        if resolution <= 0:
+            raise ValueError(f'invalid resolution: {resolution!r}')
+        self.resolution = resolution
+        self.anchor = anchor
+        self._lock = threading.Lock()
+        self._anchor = None
+        self._tick = None
+
+    def __call__(self):
+        return self._current()[1]
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(resolution={self.resolution!r}, anchor={self.anchor!r})'
+
+    def now(self, tzinfo):
+        _, value, zones = self._current()
+        key = id(tzinfo)
+        found = zones.get(key)
+        if found is None or found[0] is not tzinfo:
+            found = zones[key] = (tzinfo, value.astimezone(tzinfo))
+        return found[1]
+
+    ###################
+    # Private Methods #
+    ###################
+
+    def _current(self):
+        tick = self._tick
+        if tick is not None and time.monotonic() - tick[0] < self.resolution / 1000:
+            return tick
+
+        with self._lock:
+            monotonic = time.monotonic()
+            tick = self._tick
+            if tick is not None and monotonic - tick[0] < self.resolution / 1000:
+                return tick
+
+            anchor = self._anchor
+            if anchor is None or monotonic - anchor[0] >= self.anchor:
+                anchor = self._anchor = (monotonic, datetime.now(timezone.utc))
+            tick = self._tick = (monotonic, anchor[1] + timedelta(seconds=monotonic - anchor[0]), {})
+            return tick
+
+
+_CLOCK = SystemClock()
+
+
+def get_clock():
+    return _CLOCK
+
+
+def set_clock(clock=None):
+    global _CLOCK
+    previous, _CLOCK = _CLOCK, SystemClock() if clock is None else clock
+    return previous
+
+
+def now(tzinfo, clock=None):
+    clock = _CLOCK if clock is None else clock
+    if isinstance(clock, Clock):
+        return clock.now(tzinfo)
+    return clock().astimezone(tzinfo)
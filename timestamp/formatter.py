@@ -1,4 +1,89 @@
 import re
+from datetime import date, datetime
+from functools import lru_cache
+
+from . import parser
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _ordinal(n):
+    if n % 100 not in (11, 12, 13):
+        r = n % 10
+        if r == 1:
+            return f'{n}st'
+        if r == 2:
+            return f'{n}nd'
+        if r == 3:
+            return f'{n}rd'
+    return f'{n}th'
+
+
+def _twelve(hour):
+    return hour if 0 < hour < 13 else abs(hour - 12)
+
+
+def _yearday(dt):
+    return dt.toordinal() - date(dt.year, 1, 1).toordinal() + 1
+
+
+def _timestamp(dt):
+    return (dt.replace(tzinfo=None) - parser.TzInfo.utcoffset(dt) - _EPOCH).total_seconds()
+
+
+def _offset(dt, sep):
+    return _offset_string(parser.TzInfo.utcoffset(dt), sep)
+
+
+@lru_cache(maxsize=512)
+def _offset_string(utcoffset, sep):
+    minutes = int(utcoffset.total_seconds() / 60)
+    sign = '+' if minutes >= 0 else '-'
+    hour, minute = divmod(abs(minutes), 60)
+    return '{}{:02d}{}{:02d}'.format(sign, hour, sep, minute)
+
+
+class FormatPlan:
+    __slots__ = ('fmt', '_template', '_renderers')
+
+    def __init__(self, fmt):
+        template = []
+        renderers = []
+        position = 0
+        for match in Formatter._FORMAT_RE.finditer(fmt):
+            template.append(self._escape(fmt[position:match.start()]))
+            token = match.group(0)
+            if token.startswith('[') and token.endswith(']'):
+                template.append(self._escape(token[1:-1]))
+            else:
+                template.append('{}')
+                renderers.append(Formatter._TOKENS[token])
+            position = match.end()
+        template.append(self._escape(fmt[position:]))
+
+        self.fmt = fmt
+        self._template = ''.join(template)
+        self._renderers = tuple(renderers)
+
+    def __call__(self, dt):
+        if not isinstance(dt, datetime):
+            dt = dt.datetime
+        return self._template.format(*[render(dt) for render in self._renderers])
+
+    def many(self, iterable):
+        template = self._template.format
+        renderers = self._renderers
+        for dt in iterable:
+            if not isinstance(dt, datetime):
+                dt = dt.datetime
+            yield template(*[render(dt) for render in renderers])
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.fmt)
+
+    @staticmethod
+    def _escape(literal):
+        return literal.replace('{', '{{').replace('}', '}}')
 
 
 class Formatter:
@@ -29,109 +114,69 @@ class Formatter:
         6: 'Saturday',
         7: 'Sunday',
     }
+    _TOKENS = {
+        'YYYY': lambda dt: '{:04d}'.format(dt.year),
+        'YYY': lambda dt: '',
+        'YY': lambda dt: '{:04d}'.format(dt.year)[2:],
+
+        'MMMM': lambda dt: Formatter._MONTHS[dt.month],
+        'MMM': lambda dt: Formatter._MONTHS[dt.month][:3],
+        'MM': lambda dt: '{:02d}'.format(dt.month),
+        'M': lambda dt: str(dt.month),
+
+        'DDDD': lambda dt: '{:03d}'.format(_yearday(dt)),
+        'DDD': lambda dt: str(_yearday(dt)),
+        'DD': lambda dt: '{:02d}'.format(dt.day),
+        'D': lambda dt: str(dt.day),
+        'Do': lambda dt: _ordinal(dt.day),
+
+        'dddd': lambda dt: Formatter._DAYS[dt.isoweekday()],
+        'ddd': lambda dt: Formatter._DAYS[dt.isoweekday()][:3],
+        'dd': lambda dt: '',
+        'd': lambda dt: str(dt.isoweekday()),
+
+        'HH': lambda dt: '{:02d}'.format(dt.hour),
+        'H': lambda dt: str(dt.hour),
+        'hh': lambda dt: '{:02d}'.format(_twelve(dt.hour)),
+        'h': lambda dt: str(_twelve(dt.hour)),
+
+        'mm': lambda dt: '{:02d}'.format(dt.minute),
+        'm': lambda dt: str(dt.minute),
+
+        'ss': lambda dt: '{:02d}'.format(dt.second),
+        's': lambda dt: str(dt.second),
+
+        'SSSSSS': lambda dt: '{:06d}'.format(dt.microsecond),
+        'SSSSS': lambda dt: '{:05d}'.format(dt.microsecond // 10),
+        'SSSS': lambda dt: '{:04d}'.format(dt.microsecond // 100),
+        'SSS': lambda dt: '{:03d}'.format(dt.microsecond // 1000),
+        'SS': lambda dt: '{:02d}'.format(dt.microsecond // 10_000),
+        'S': lambda dt: str(dt.microsecond // 100_000),
+
+        'X': lambda dt: str(_timestamp(dt)),
+        'x': lambda dt: str(int(_timestamp(dt) * 1_000_000)),
+
+        'ZZZ': lambda dt: parser.TzInfo.tzname(dt) or '',
+        'ZZ': lambda dt: _offset(dt, ':'),
+        'Z': lambda dt: _offset(dt, ''),
+
+        'a': lambda dt: 'am' if dt.hour < 12 else 'pm',
+        'A': lambda dt: 'AM' if dt.hour < 12 else 'PM',
+
+        'W': lambda dt: '{}-W{:02d}-{}'.format(*dt.isocalendar()),
+    }
 
     def __new__(cls, dt, fmt):
-        return cls._FORMAT_RE.sub(lambda x: cls._token(dt, x.group(0)), fmt)
+        return cls.compile(fmt)(dt)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def compile(fmt):
+        return FormatPlan(fmt)
 
     @classmethod
-    def _token(cls, dt, token):
-        if token and token.startswith('[') and token.endswith(']'):
-            return token[1:-1]
-
-        if token == 'YYYY':
-            return '{:04d}'.format(dt.year)
-        if token == 'YY':
-            return '{:04d}'.format(dt.year)[2:]
-
-        if token == 'MMMM':
-            return cls._MONTHS[dt.month]
-        if token == 'MMM':
-            return cls._MONTHS[dt.month][:3]
-        if token == 'MM':
-            return '{:02d}'.format(dt.month)
-        if token == 'M':
-            return str(dt.month)
-
-        if token == 'DDDD':
-            return '{:03d}'.format(dt.tmyearday)
-        if token == 'DDD':
-            return str(dt.tmyearday)
-        if token == 'DD':
-            return '{:02d}'.format(dt.day)
-        if token == 'D':
-            return str(dt.day)
-
-        if token == 'DO':
-            n = dt.day
-            if n % 100 not in (11, 12, 13):
-                r = n % 100
-                if r == 1:
-                    return f'{n}st'
-                if r == 2:
-                    return f'{n}nd'
-                if r == 3:
-                    return f'{n}rd'
-            return f'{n}th'
-
-        if token == 'dddd':
-            return cls._DAYS[dt.isoweekday]
-        if token == 'ddd':
-            return cls._DAYS[dt.isoweekday][:3]
-        if token == 'd':
-            return str(dt.isoweekday)
-
-        if token == 'HH':
-            return '{:02d}'.format(dt.hour)
-        if token == 'H':
-            return str(dt.hour)
-        if token == 'hh':
-            return '{:02d}'.format(dt.hour if 0 < dt.hour < 13 else abs(dt.hour - 12))
-        if token == 'h':
-            return str(dt.hour if 0 < dt.hour < 13 else abs(dt.hour - 12))
-
-        if token == 'mm':
-            return '{:02d}'.format(dt.minute)
-        if token == 'm':
-            return str(dt.minute)
-
-        if token == 'ss':
-            return '{:02d}'.format(dt.second)
-        if token == 's':
-            return str(dt.second)
-
-        if token == 'SSSSSS':
-            return '{:06d}'.format(int(dt.microsecond))
-        if token == 'SSSSS':
-            return '{:05d}'.format(int(dt.microsecond / 10))
-        if token == 'SSSS':
-            return '{:04d}'.format(int(dt.microsecond / 100))
-        if token == 'SSS':
-            return '{:03d}'.format(int(dt.microsecond / 1000))
-        if token == 'SS':
-            return '{:02d}'.format(int(dt.microsecond / 10_000))
-        if token == 'S':
-            return str(int(dt.micsecond / 100_000))
-
-        if token == 'X':
-            return str(dt.timestamp)
-        if token == 'x':
-            return str(int(dt.timestamp * 1_000_000))
-
-        if token == 'ZZZ':
-            return dt.tzname
-        if token in ('Z', 'ZZ'):
-            sep = ':' if token == 'ZZ' else ''
-            minutes = int(dt.utcoffset.total_seconds() / 60)
-            sign = '+' if minutes >= 0 else '-'
-            minutes = abs(minutes)
-            hour, minute = divmod(minutes, 60)
-            return '{}{:02d}{}{:02d}'.format(sign, hour, sep, minute)
-
-        if token == 'a':
-            return 'am' if dt.hour < 12 else 'pm'
-        if token == 'A':
-            return 'AM' if dt.hour < 12 else 'PM'
-
-        if token == 'W':
-            y, w, d = dt.isocalendar
-            return '{}-W{:02d}-{}'.format(y, w, d)
+    def format_many(cls, iterable, fmt, stream=False):
+        results = cls.compile(fmt).many(iterable)
+        if stream:
+            return results
+        return list(results)
@@ -0,0 +1,122 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+from . import Timestamp, parser, util
+
+
+class TimestampIndex:
+    __slots__ = ('_items', '_positions', '_values', '_tzinfo')
+
+    def __init__(self, items, tz=None):
+        self._tzinfo = Timestamp.tzparser(tz)
+        items = list(items)
+        keys = [self._key(item) for item in items]
+        positions = sorted(range(len(keys)), key=keys.__getitem__)
+        self._items = items
+        self._positions = tuple(positions)
+        self._values = tuple(keys[i] for i in positions)
+
+    def __contains__(self, item):
+        key = self._key(item)
+        index = bisect_left(self._values, key)
+        return index < len(self._values) and self._values[index] == key
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._items[i] for i in self._positions[index]]
+        return self._items[self._positions[index]]
+
+    def __iter__(self):
+        for i in self._positions:
+            yield self._items[i]
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return '{}(<{} items>, tz={!r})'.format(self.__class__.__name__, len(self), self.tz)
+
+    ##############
+    # Properties #
+    ##############
+
+    @property
+    def positions(self):
+        return self._positions
+
+    @property
+    def tz(self):
+        return parser.TzInfo.extract(self._tzinfo)
+
+    @property
+    def tzinfo(self):
+        return self._tzinfo
+
+    @property
+    def values(self):
+        return self._values
+
+    ####################
+    # Instance Methods #
+    ####################
+
+    def after(self, moment, inclusive=False):
+        key = self._key(moment)
+        start = bisect_left(self._values, key) if inclusive else bisect_right(self._values, key)
+        return slice(start, len(self._values))
+
+    def before(self, moment, inclusive=False):
+        key = self._key(moment)
+        stop = bisect_right(self._values, key) if inclusive else bisect_left(self._values, key)
+        return slice(0, stop)
+
+    def between(self, start, end, bounds='[)'):
+        util.validate_bounds(bounds)
+        lower, upper = self._key(start), self._key(end)
+        values = self._values
+        lo = bisect_left(values, lower) if bounds[0] == '[' else bisect_right(values, lower)
+        hi = bisect_right(values, upper) if bounds[1] == ']' else bisect_left(values, upper)
+        return slice(lo, max(lo, hi))
+
+    def nearest(self, moment):
+        values = self._values
+        if not values:
+            raise ValueError('nearest() on an empty index')
+        key = self._key(moment)
+        index = bisect_left(values, key)
+        if index == len(values):
+            return index - 1
+        if index and key - values[index - 1] <= values[index] - key:
+            return index - 1
+        return index
+
+    def searchsorted(self, moments, side='left'):
+        if side not in ('left', 'right'):
+            raise ValueError(f"invalid side: {side!r} not in ('left', 'right')")
+        if hasattr(moments, 'dtype'):
+            from .array import np
+
+            moments = np.asarray(moments)
+            if moments.dtype.kind == 'M':
+                keys = moments.astype('M8[us]').astype('int64')
+            else:
+                keys = np.asarray(util.epoch_us_many(moments), dtype='int64')
+            return np.searchsorted(np.asarray(self._values, dtype='int64'), keys, side=side)
+
+        search = bisect_left if side == 'left' else bisect_right
+        values = self._values
+        return [search(values, self._key(moment)) for moment in moments]
+
+    ###################
+    # Private Methods #
+    ###################
+
+    def _key(self, value):
+        if Timestamp.is_self(value):
+            return util.epoch_us(value.datetime)
+        elif isinstance(value, datetime) and value.tzinfo is not None:
+            return util.epoch_us(value)
+        converted = Timestamp.get(value, tzinfo=self._tzinfo)
+        if converted is None:
+            raise ValueError(f'not DateTool convertable: {value!r}')
+        return util.epoch_us(converted.datetime)
@@ -0,0 +1,194 @@
+import functools
+from contextlib import contextmanager
+from time import perf_counter
+
+_TARGETS = (
+    ('Timestamp', '__init__'),
+    ('Timestamp', 'get'),
+    ('Timestamp', 'fromdatetime'),
+    ('Timestamp', 'fromtimestamp'),
+    ('Timestamp', 'format'),
+    ('Timestamp', 'humanize'),
+    ('Timestamp', 'shift'),
+    ('Timestamp', 'span'),
+    ('Timestamp', 'strptime'),
+    ('Timestamp', 'to'),
+    ('Timestamp', 'xlate'),
+    ('IsoParser', 'parse'),
+    ('TzInfo', 'parse'),
+)
+
+enabled = False
+
+
+class Histogram:
+    __slots__ = ('count', 'total', 'min', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = {}
+
+    def add(self, seconds):
+        micros = seconds * 1_000_000
+        self.count += 1
+        self.total += micros
+        if self.min is None or micros < self.min:
+            self.min = micros
+        if self.max is None or micros > self.max:
+            self.max = micros
+        bucket = 1 << int(micros).bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, p):
+        rank = p * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return bucket
+        return None
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'total_us': self.total,
+            'mean_us': self.total / self.count if self.count else None,
+            'min_us': self.min,
+            'max_us': self.max,
+            'p50_us': self.percentile(0.5),
+            'p99_us': self.percentile(0.99),
+            'buckets': dict(sorted(self.buckets.items())),
+        }
+
+
+class Collector:
+    def __init__(self):
+        self.counters = {}
+        self.timings = {}
+
+    def count(self, name, n):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def record(self, name, seconds):
+        histogram = self.timings.get(name)
+        if histogram is None:
+            histogram = self.timings[name] = Histogram()
+        histogram.add(seconds)
+
+    def reset(self):
+        self.counters.clear()
+        self.timings.clear()
+
+    def snapshot(self):
+        return {
+            'counters': dict(sorted(self.counters.items())),
+            'timings': {k: v.snapshot() for k, v in sorted(self.timings.items())},
+        }
+
+
+_GLOBAL = Collector()
+_ACTIVE = []
+_ORIGINALS = {}
+
+
+def count(name, n=1):
+    if enabled:
+        for collector in _ACTIVE:
+            collector.count(name, n)
+
+
+def disable():
+    if _GLOBAL in _ACTIVE:
+        _ACTIVE.remove(_GLOBAL)
+    _update()
+
+
+def enable():
+    if _GLOBAL not in _ACTIVE:
+        _ACTIVE.append(_GLOBAL)
+    _update()
+
+
+@contextmanager
+def profile():
+    collector = Collector()
+    _ACTIVE.append(collector)
+    _update()
+    try:
+        yield collector
+    finally:
+        _ACTIVE.remove(collector)
+        _update()
+
+
+def record(name, seconds):
+    if enabled:
+        for collector in _ACTIVE:
+            collector.record(name, seconds)
+
+
+def reset():
+    _GLOBAL.reset()
+
+
+def snapshot():
+    return _GLOBAL.snapshot()
+
+
+###################
+# Private Methods #
+###################
+
+def _owners():
+    from . import Timestamp, parser
+    return {
+        'Timestamp': Timestamp,
+        'IsoParser': parser.IsoParser,
+        'TzInfo': parser.TzInfo,
+    }
+
+
+def _timed(name, fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            record(name, perf_counter() - start)
+    return wrapper
+
+
+def _update():
+    global enabled
+    if _ACTIVE and not enabled:
+        _patch()
+    elif not _ACTIVE and enabled:
+        _unpatch()
+    enabled = bool(_ACTIVE)
+
+
+def _patch():
+    owners = _owners()
+    for owner, attr in _TARGETS:
+        cls = owners[owner]
+        raw = cls.__dict__[attr]
+        name = f'{owner}.{attr}'
+        if isinstance(raw, classmethod):
+            wrapped = classmethod(_timed(name, raw.__func__))
+        elif isinstance(raw, staticmethod):
+            wrapped = staticmethod(_timed(name, raw.__func__))
+        else:
+            wrapped = _timed(name, raw)
+        _ORIGINALS[(owner, attr)] = raw
+        setattr(cls, attr, wrapped)
+
+
+def _unpatch():
+    owners = _owners()
+    for (owner, attr), raw in _ORIGINALS.items():
+        setattr(owners[owner], attr, raw)
+    _ORIGINALS.clear()
@@ -0,0 +1,124 @@
+import mmap
+import os
+import re
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from . import Timestamp, parser, util
+
+NAT = -(2 ** 63)
+
+ParseResult = namedtuple('ParseResult', ['values', 'invalid'])
+
+
+def scan(path, column=0, delimiter=None, fmt=None, tz=None, epoch=False, chunksize=65_536, errors='raise'):
+    for chunk, _ in _scan(path, column, delimiter, fmt, tz, epoch, chunksize, errors):
+        if chunk:
+            yield chunk
+
+
+def parse_file(path, column=0, delimiter=None, fmt=None, tz=None, workers=None, errors='raise'):
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1:
+        raise ValueError(f'invalid workers: {workers!r}')
+
+    ranges = _ranges(path, workers * 4)
+    args = [(path, column, delimiter, fmt, tz, errors, start, stop) for start, stop in ranges]
+    if workers == 1 or len(ranges) < 2:
+        results = [_parse_range(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_parse_range, *zip(*args)))
+
+    values = array('q')
+    invalid = 0
+    for chunk, count in results:
+        values += chunk
+        invalid += count
+    return ParseResult(values, invalid)
+
+
+###################
+# Private Methods #
+###################
+
+def _field_re(column, delimiter):
+    if column < 0:
+        raise ValueError(f'invalid column: {column!r}')
+    if delimiter is None:
+        return re.compile(rb'[ \t]*(?:[^\s]+[ \t]+){%d}([^\s]+)' % column)
+    if isinstance(delimiter, str):
+        delimiter = delimiter.encode()
+    if len(delimiter) != 1 or delimiter in b'\r\n':
+        raise ValueError(f'invalid delimiter: {delimiter!r}')
+    d = re.escape(delimiter)
+    return re.compile(rb'(?:[^%s\r\n]*%s){%d}([^%s\r\n]*)' % (d, d, column, d))
+
+
+def _fields(buffer, start, stop, pattern):
+    match = pattern.match
+    while start < stop:
+        end = buffer.find(b'\n', start, stop)
+        if end < 0:
+            end = stop
+        found = match(buffer, start, end)
+        if found is not None and found.end(1) > found.start(1):
+            yield found.group(1).decode(errors='replace')
+        elif buffer[start:end].strip():
+            yield None
+        start = end + 1
+
+
+def _parse_range(path, column, delimiter, fmt, tz, errors, start, stop):
+    values = array('q')
+    invalid = 0
+    for chunk, count in _scan(path, column, delimiter, fmt, tz, True, 65_536, errors, start, stop):
+        if count and errors == 'coerce':
+            chunk = [NAT if value is None else value for value in chunk]
+        values.extend(chunk)
+        invalid += count
+    return values, invalid
+
+
+def _ranges(path, count):
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            bounds = [0]
+            for i in range(1, count):
+                position = buffer.find(b'\n', max(bounds[-1], size * i // count))
+                if position < 0:
+                    break
+                bounds.append(position + 1)
+    bounds.append(size)
+    return [(start, stop) for start, stop in zip(bounds, bounds[1:]) if start < stop]
+
+
+def _scan(path, column, delimiter, fmt, tz, epoch, chunksize, errors, start=0, stop=None):
+    if chunksize < 1:
+        raise ValueError(f'invalid chunksize: {chunksize!r}')
+    pattern = _field_re(column, delimiter)
+    bulk = parser.BulkParser(Timestamp, tz=tz, fmt=fmt)
+
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        stop = size if stop is None else min(stop, size)
+        if start >= stop:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            results = bulk.parse(_fields(buffer, start, stop, pattern), errors=errors)
+            seen = 0
+            while True:
+                chunk = list(islice(results, chunksize))
+                invalid, seen = bulk.invalid - seen, bulk.invalid
+                if not chunk:
+                    if invalid:
+                        yield chunk, invalid
+                    return
+                if epoch:
+                    chunk = [None if ts is None else util.epoch_us(ts.datetime) for ts in chunk]
+                yield chunk, invalid
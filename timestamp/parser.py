@@ -1,10 +1,38 @@
 import re
-from datetime import tzinfo as dtzinfo
+from bisect import bisect_left, bisect_right
+from collections import Counter, namedtuple
+from datetime import datetime, timedelta, timezone, tzinfo as dtzinfo
+from itertools import chain, islice
 from dateutil import tz as dtz
 
+from . import instrument, util
+
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def __getattr__(name):
+    if name == 'ParserError':
+        from dateutil.parser import ParserError
+        return ParserError
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
 
 class TzInfo:
     _TZINFO_RE = re.compile(r"^([\+\-])?(\d{2})(?:\:?(\d{2}))?$")
+    _RESOLVED = frozenset([dtz.tzutc, dtz.tzlocal, dtz.tzfile, dtz.tzoffset])
+    _INTERNED = {}
+    _INTERNED_SIZE = 1024
+    _FIXED = (dtz.tzutc, dtz.tzoffset, timezone)
+    _DAYS = {}
+    _DAYS_SIZE = 4096
+    _TRANSITIONS = {}
+    _TRANSITIONS_SIZE = 4096
+
+    _hits = 0
+    _misses = 0
 
     @staticmethod
     def get(tzinfo):
@@ -14,8 +42,43 @@ class TzInfo:
 
     @classmethod
     def parse(cls, tzo, **kwargs):
+        if tzo.__class__ in cls._RESOLVED:
+            return tzo
+
+        internable = tzo is None or isinstance(tzo, str)
+        if internable:
+            tzinfo = cls._INTERNED.get(tzo)
+            if tzinfo is not None:
+                cls._hits += 1
+                return tzinfo
+            cls._misses += 1
+            instrument.count('TzInfo.parse.miss')
+
+        tzinfo = cls._parse(tzo, **kwargs)
+        if tzinfo is None:
+            if kwargs.get('safetz', False):
+                instrument.count('TzInfo.parse.safetz')
+                return dtz.tzutc()
+            raise ValueError(f'Invalid time zone: {tzo!r}')
+
+        if internable:
+            if len(cls._INTERNED) >= cls._INTERNED_SIZE:
+                cls._INTERNED.clear()
+            cls._INTERNED[tzo] = tzinfo
+        return tzinfo
+
+    @classmethod
+    def cache_info(cls):
+        return CacheInfo(cls._hits, cls._misses, cls._INTERNED_SIZE, len(cls._INTERNED))
+
+    @classmethod
+    def cache_clear(cls):
+        cls._INTERNED.clear()
+        cls._hits = cls._misses = 0
+
+    @classmethod
+    def _parse(cls, tzo, **kwargs):
         tzinfo = None
-        safe = kwargs.get('safetz', False)
 
         if isinstance(tzo, (dtz.tzutc, dtz.tzlocal, dtz.tzfile, dtz.tzoffset)):
             return tzo
@@ -44,13 +107,151 @@ class TzInfo:
                     seconds *= -1
                 return dtz.tzoffset(None, seconds)
 
-            tzinfo = cls.get(tzo)
-            if tzinfo is None:
-                if safe:
-                    return dtz.tzutc()
-                else:
-                    raise ValueError(f'Invalid time zone: {tzo!r}')
-            return tzinfo
+            return cls.get(tzo)
+
+    @classmethod
+    def offset(cls, tzinfo, seconds):
+        return datetime.fromtimestamp(seconds, tzinfo).replace(tzinfo=None) - (_EPOCH + timedelta(seconds=seconds))
+
+    @classmethod
+    def fromutc_many(cls, tzinfo, values):
+        if not values:
+            return []
+        epoch = datetime(1970, 1, 1, tzinfo=tzinfo)
+        if isinstance(tzinfo, cls._FIXED):
+            epoch += tzinfo.utcoffset(None)
+            return [epoch + timedelta(microseconds=v) for v in values]
+
+        first = max(util.MIN_YEAR + 1, util.from_epoch_us(min(values)).year - 1)
+        last = min(util.MAX_YEAR - 1, util.from_epoch_us(max(values)).year + 1)
+        transitions = [t for year in range(first, last + 1) for t in cls.transitions(tzinfo, year)]
+        if transitions:
+            base = transitions[0][1]
+        else:
+            base = cls.offset(tzinfo, (datetime(first, 1, 1) - _EPOCH) // _SECOND)
+
+        bounds = [t * 1_000_000 for t, _, _ in transitions]
+        offsets = [base] + [after for _, _, after in transitions]
+        if len(offsets) == 1:
+            epoch += base
+            return [epoch + timedelta(microseconds=v) for v in values]
+        return [epoch + offsets[bisect_right(bounds, v)] + timedelta(microseconds=v) for v in values]
+
+    @classmethod
+    def transitions(cls, tzinfo, year):
+        if isinstance(tzinfo, cls._FIXED):
+            return ()
+
+        key = (id(tzinfo), year)
+        entry = cls._TRANSITIONS.get(key)
+        if entry is not None and entry[0] is tzinfo:
+            return entry[1]
+
+        start = (datetime(year, 1, 1) - _EPOCH) // _SECOND
+        end = start + (366 if util.isleap(year) else 365) * 86_400
+        candidates = getattr(tzinfo, '_trans_list_utc', None)
+        if isinstance(tzinfo, dtz.tzfile) and candidates is not None:
+            result = []
+            for moment in candidates[bisect_left(candidates, start):bisect_left(candidates, end)]:
+                before = cls.offset(tzinfo, moment - 1)
+                after = cls.offset(tzinfo, moment)
+                if after != before:
+                    result.append((moment, before, after))
+        else:
+            result = cls._sample_transitions(tzinfo, start, end)
+
+        if len(cls._TRANSITIONS) >= cls._TRANSITIONS_SIZE:
+            cls._TRANSITIONS.clear()
+        cls._TRANSITIONS[key] = (tzinfo, tuple(result))
+        return tuple(result)
+
+    @classmethod
+    def _sample_transitions(cls, tzinfo, start, end):
+        result = []
+        day = start
+        before = cls.offset(tzinfo, day)
+        while day < end:
+            after = cls.offset(tzinfo, day + 86_400)
+            if after != before:
+                lo, hi = day, day + 86_400
+                while hi - lo > 1:
+                    mid = (lo + hi) // 2
+                    if cls.offset(tzinfo, mid) == before:
+                        lo = mid
+                    else:
+                        hi = mid
+                result.append((hi, before, after))
+                before = after
+            day += 86_400
+        return result
+
+    @classmethod
+    def gaps(cls, tzinfo, year):
+        result = []
+        for seconds, before, after in cls.transitions(tzinfo, year):
+            if after > before:
+                moment = _EPOCH + timedelta(seconds=seconds)
+                result.append((moment + before, moment + after))
+        return tuple(result)
+
+    @classmethod
+    def near_transition(cls, dt):
+        tzinfo = dt.tzinfo
+        if isinstance(tzinfo, cls._FIXED):
+            return False
+        trans = getattr(tzinfo, '_trans_list', None)
+        if trans is None:
+            return True
+        seconds = (dt.replace(tzinfo=None) - _EPOCH) // _SECOND
+        index = bisect_right(trans, seconds)
+        return (index > 0 and seconds - trans[index - 1] < 172_800) or (
+            index < len(trans) and trans[index] - seconds < 172_800
+        )
+
+    @classmethod
+    def resolve(cls, dt):
+        if not cls.near_transition(dt) or dtz.datetime_exists(dt):
+            return dt
+        instrument.count('TzInfo.resolve.imaginary')
+        return dtz.resolve_imaginary(dt)
+
+    @classmethod
+    def day(cls, dt):
+        tzinfo = dt.tzinfo
+        key = (id(tzinfo), dt.toordinal())
+        entry = cls._DAYS.get(key)
+        if entry is not None and entry[0] is tzinfo:
+            return entry[1]
+
+        start = dt.replace(hour=0, minute=0, second=0, microsecond=0, fold=0)
+        end = dt.replace(hour=23, minute=59, second=59, microsecond=999_999, fold=0)
+        offset = start.utcoffset()
+        name = start.tzname()
+        if offset != end.utcoffset() or name != end.tzname():
+            offset = name = None
+
+        if len(cls._DAYS) >= cls._DAYS_SIZE:
+            cls._DAYS.clear()
+        cls._DAYS[key] = (tzinfo, (offset, name))
+        return offset, name
+
+    @classmethod
+    def utcoffset(cls, dt):
+        if isinstance(dt.tzinfo, (dtz.tzutc, dtz.tzoffset)):
+            return dt.utcoffset()
+        offset = cls.day(dt)[0]
+        if offset is None:
+            return dt.utcoffset()
+        return offset
+
+    @classmethod
+    def tzname(cls, dt):
+        if isinstance(dt.tzinfo, (dtz.tzutc, dtz.tzoffset)):
+            return dt.tzname()
+        name = cls.day(dt)[1]
+        if name is None:
+            return dt.tzname()
+        return name
 
     @classmethod
     def extract(cls, tzinfo):
@@ -69,3 +270,465 @@ class TzInfo:
             )
         except Exception:
             return 'unknown'
+
+
+class IsoParser:
+    _ISO_RE = re.compile(
+        r"(\d{4})-(\d{2})-(\d{2})"
+        r"(?:[Tt ](\d{2})(?::(\d{2})(?::(\d{2})(?:[\.,](\d+))?)?)?"
+        r" ?(?:([Zz])|([\+\-])(\d{2})(?::?(\d{2}))?)?)?"
+    )
+
+    fallbacks = 0
+
+    @classmethod
+    def parse(cls, string):
+        if isinstance(string, str):
+            dt = cls.fromisoformat(string)
+            if dt is None:
+                dt = cls.match(string)
+            if dt is not None:
+                return dt
+            cls.fallbacks += 1
+            instrument.count('IsoParser.parse.fallback')
+        from dateutil.parser import parse as dtp
+        return dtp(string)
+
+    @classmethod
+    def fromisoformat(cls, string):
+        if len(string) < 10 or string[4] != '-' or string[7] != '-':
+            return None
+        if len(string) > 10 and string[10] not in 'Tt ':
+            return None
+        try:
+            dt = datetime.fromisoformat(string)
+        except ValueError:
+            return None
+        if dt.tzinfo is None:
+            return dt
+        seconds = dt.utcoffset() // _SECOND
+        if seconds % 60 or dt.utcoffset() % _SECOND:
+            return None
+        return dt.replace(tzinfo=cls._tzinfo(seconds))
+
+    @classmethod
+    def match(cls, string):
+        match = cls._ISO_RE.fullmatch(string)
+        if match is None:
+            return None
+
+        year, month, day, hour, minute, second, fraction, utc, sign, hours, minutes = match.groups()
+        tzinfo = None
+        if utc:
+            tzinfo = dtz.tzutc()
+        elif sign:
+            if int(hours) > 23 or int(minutes or 0) > 59:
+                return None
+            seconds = int(hours) * 3600 + int(minutes or 0) * 60
+            tzinfo = cls._tzinfo(-seconds if sign == '-' else seconds)
+        try:
+            return datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour or 0),
+                int(minute or 0),
+                int(second or 0),
+                int(fraction[:6].ljust(6, '0')) if fraction else 0,
+                tzinfo,
+            )
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _tzinfo(seconds):
+        if seconds == 0:
+            return dtz.tzutc()
+        return dtz.tzoffset(None, seconds)
+
+
+class StrptimePlan:
+    __slots__ = ('fmt', 'factory', 'tokens', '_regex', '_fields', '_epoch', '_layout', '_months')
+
+    _DIRECTIVES = {
+        'Y': ('year', r'\d\d\d\d'),
+        'y': ('year2', r'\d\d'),
+        'm': ('month', r'1[0-2]|0[1-9]|[1-9]'),
+        'b': ('monthname', None),
+        'B': ('monthname', None),
+        'd': ('day', r'3[01]|[12]\d|0[1-9]|[1-9]| [1-9]'),
+        'a': (None, None),
+        'A': (None, None),
+        'H': ('hour', r'2[0-3]|[0-1]\d|\d'),
+        'I': ('hour12', r'1[0-2]|0[1-9]|[1-9]'),
+        'p': ('ampm', r'am|pm'),
+        'M': ('minute', r'[0-5]\d|\d'),
+        'S': ('second', r'6[0-1]|[0-5]\d|\d'),
+        'f': ('fraction', r'[0-9]{1,6}'),
+        'z': ('offset', r'[+-]\d\d:?[0-5]\d(?::?[0-5]\d(?:\.\d{1,6})?)?|(?-i:Z)'),
+    }
+    _TOKENS = {
+        'YYYY': ('year', r'\d{4}'),
+        'YYY': (None, ''),
+        'YY': ('year2', r'\d{2}'),
+        'MMMM': ('monthname', None),
+        'MMM': ('monthname', None),
+        'MM': ('month', r'\d{2}'),
+        'M': ('month', r'\d{1,2}'),
+        'DDDD': ('yearday', r'\d{3}'),
+        'DDD': ('yearday', r'\d{1,3}'),
+        'DD': ('day', r'\d{2}'),
+        'D': ('day', r'\d{1,2}'),
+        'Do': ('ordinal', r'\d{1,2}(?:st|nd|rd|th)'),
+        'dddd': (None, None),
+        'ddd': (None, None),
+        'dd': (None, ''),
+        'd': (None, r'[1-7]'),
+        'HH': ('hour', r'\d{2}'),
+        'H': ('hour', r'\d{1,2}'),
+        'hh': ('hour12', r'\d{2}'),
+        'h': ('hour12', r'\d{1,2}'),
+        'mm': ('minute', r'\d{2}'),
+        'm': ('minute', r'\d{1,2}'),
+        'ss': ('second', r'\d{2}'),
+        's': ('second', r'\d{1,2}'),
+        'SSSSSS': ('fraction', r'\d{6}'),
+        'SSSSS': ('fraction', r'\d{5}'),
+        'SSSS': ('fraction', r'\d{4}'),
+        'SSS': ('fraction', r'\d{3}'),
+        'SS': ('fraction', r'\d{2}'),
+        'S': ('fraction', r'\d'),
+        'X': ('epoch', r'-?\d+(?:\.\d+)?'),
+        'x': ('epoch_us', r'-?\d+'),
+        'ZZ': ('offset', r'[+-]\d{2}:\d{2}'),
+        'Z': ('offset', r'[+-]\d{4}'),
+        'a': ('ampm', r'am|pm'),
+        'A': ('ampm', r'AM|PM'),
+        'W': ('isoweek', r'\d{4}-W\d{2}-[1-7]'),
+    }
+    _LAYOUT = ('year', 'month', 'day', 'hour', 'minute', 'second', 'fraction', 'offset')
+    _GROUPS = {
+        'year2': 'year',
+        'monthname': 'month',
+        'ordinal': 'day',
+        'hour12': 'hour',
+        'epoch_us': 'epoch',
+    }
+    _TOKEN_RE = re.compile(
+        r"(\[(?:(?=(?P<literal>[^]]))(?P=literal))*\]|YYY?Y?|MM?M?M?"
+        r"|Do|DD?D?D?|d?dd?d?|HH?|hh?|mm?|ss?|SS?S?S?S?S?|ZZ?Z?|a|A|X|x|W)"
+    )
+
+    def __init__(self, fmt, factory, tokens=None):
+        self.fmt = fmt
+        self.factory = factory
+        from calendar import month_abbr, month_name
+        self.tokens = '%' not in fmt if tokens is None else tokens
+        self._months = {
+            n.lower(): i % 12 or 12 for i, n in enumerate(month_name[1:] + month_abbr[1:], 1)
+        }
+        translated = self._translate_tokens(fmt) if self.tokens else self._translate_strptime(fmt)
+        if translated is None:
+            self._regex = None
+            self._fields = ()
+            self._epoch = False
+            self._layout = None
+        else:
+            pattern, fields, flags = translated
+            self._regex = re.compile(pattern, flags)
+            self._fields = tuple(fields)
+            self._epoch = any(f in ('epoch', 'epoch_us') for f in self._fields)
+            self._layout = None
+            if set(fields) <= set(self._LAYOUT) | {None}:
+                self._layout = tuple(fields.index(f) if f in fields else None for f in self._LAYOUT)
+
+    def __call__(self, string, tzinfo=None):
+        dt = self.parse(string)
+        if self._epoch:
+            return self.factory._wrap(dt.astimezone(TzInfo.parse(tzinfo)))
+        return self.factory.fromdatetime(dt, tzinfo=tzinfo)
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.fmt)
+
+    def parse(self, string):
+        if self._regex is None:
+            dt = datetime.strptime(string, self.fmt)
+            if dt.tzinfo is not None:
+                dt = dt.replace(tzinfo=self._tzinfo(dt.utcoffset()))
+            return dt
+
+        match = self._regex.match(string)
+        if match is None or match.end() != len(string):
+            raise ValueError(f'time data {string!r} does not match format {self.fmt!r}')
+        if self._layout is not None:
+            return self._direct(match.groups())
+        values = dict(zip(self._fields, match.groups()))
+        values.pop(None, None)
+
+        if 'epoch' in values:
+            value = values['epoch']
+            seconds, _, fraction = value.lstrip('-').partition('.')
+            delta = timedelta(seconds=int(seconds), microseconds=int(fraction[:6].ljust(6, '0')))
+            return util.EPOCH - delta if value.startswith('-') else util.EPOCH + delta
+        if 'epoch_us' in values:
+            return util.EPOCH + timedelta(microseconds=int(values['epoch_us']))
+        return self._build(values)
+
+    ###################
+    # Private Methods #
+    ###################
+
+    def _direct(self, groups):
+        year, month, day, hour, minute, second, fraction, offset = [
+            None if i is None else groups[i] for i in self._layout
+        ]
+        return datetime(
+            int(year) if year else 1900,
+            int(month) if month else 1,
+            int(day) if day else 1,
+            int(hour) if hour else 0,
+            int(minute) if minute else 0,
+            int(second) if second else 0,
+            int(fraction.ljust(6, '0')) if fraction else 0,
+            self._offset(offset) if offset else None,
+        )
+
+    def _build(self, values):
+        year = 1900
+        if 'year' in values:
+            year = int(values['year'])
+        elif 'year2' in values:
+            year = int(values['year2'])
+            year += 2000 if year <= 68 else 1900
+
+        month = 1
+        if 'month' in values:
+            month = int(values['month'])
+        elif 'monthname' in values:
+            month = self._months[values['monthname'].lower()]
+
+        day = 1
+        if 'day' in values:
+            day = int(values['day'])
+        elif 'ordinal' in values:
+            day = int(values['ordinal'][:-2])
+
+        if 'yearday' in values:
+            yearday = int(values['yearday'])
+            if not 0 < yearday <= (366 if util.isleap(year) else 365):
+                raise ValueError(f'day of year out of range: {yearday!r}')
+            moment = datetime(year, 1, 1) + timedelta(days=yearday - 1)
+            month, day = moment.month, moment.day
+        if 'isoweek' in values:
+            isoyear, week, weekday = values['isoweek'].split('-')
+            moment = util.fromisocalendar(int(isoyear), int(week[1:]), int(weekday))
+            year, month, day = moment.year, moment.month, moment.day
+
+        hour = 0
+        if 'hour' in values:
+            hour = int(values['hour'])
+        elif 'hour12' in values:
+            hour = int(values['hour12']) % 12
+            if values.get('ampm', '').lower() == 'pm':
+                hour += 12
+
+        return datetime(
+            year,
+            month,
+            day,
+            hour,
+            int(values.get('minute', 0)),
+            int(values.get('second', 0)),
+            int(values['fraction'].ljust(6, '0')) if 'fraction' in values else 0,
+            self._offset(values['offset']) if 'offset' in values else None,
+        )
+
+    @classmethod
+    def _offset(cls, value):
+        if value == 'Z':
+            return dtz.tzutc()
+        if value[3] == ':':
+            value = value[:3] + value[4:]
+            if len(value) > 5:
+                if value[5] != ':':
+                    raise ValueError(f'inconsistent use of : in {value!r}')
+                value = value[:5] + value[6:]
+        offset = timedelta(
+            hours=int(value[1:3]),
+            minutes=int(value[3:5]),
+            seconds=int(value[5:7] or 0),
+            microseconds=int(value[8:].ljust(6, '0')),
+        )
+        if offset >= timedelta(days=1):
+            raise ValueError(f'offset must be strictly between -24 and 24 hours: {value!r}')
+        return cls._tzinfo(-offset if value[0] == '-' else offset)
+
+    @staticmethod
+    def _names(names):
+        return '|'.join(sorted((re.escape(n) for n in names if n), key=len, reverse=True))
+
+    def _pattern(self, field, pattern):
+        from calendar import day_abbr, day_name, month_abbr, month_name
+        if field == 'monthname':
+            names = month_name[1:] + month_abbr[1:]
+            return self._names(names) if not self.tokens else f'(?i:{self._names(names)})'
+        if pattern is None:
+            names = day_name[:] + day_abbr[:]
+            return self._names(names) if not self.tokens else f'(?i:{self._names(names)})'
+        return pattern
+
+    @staticmethod
+    def _tzinfo(offset):
+        if offset % _SECOND:
+            return dtz.tzoffset(None, offset)
+        return IsoParser._tzinfo(offset // _SECOND)
+
+    def _translate_strptime(self, fmt):
+        pattern = []
+        fields = []
+        groups = set()
+        i = 0
+        while i < len(fmt):
+            char = fmt[i]
+            if char == '%':
+                directive = fmt[i + 1:i + 2]
+                if directive == '%':
+                    pattern.append('%')
+                elif directive in self._DIRECTIVES:
+                    field, regex = self._DIRECTIVES[directive]
+                    group = self._GROUPS.get(field, field)
+                    if group is not None and group in groups:
+                        return None
+                    groups.add(group)
+                    pattern.append(f'({self._pattern(field, regex)})')
+                    fields.append(field)
+                else:
+                    return None
+                i += 2
+            elif char.isspace():
+                while i < len(fmt) and fmt[i].isspace():
+                    i += 1
+                pattern.append(r'\s+')
+            else:
+                pattern.append(re.escape(char))
+                i += 1
+        return ''.join(pattern), fields, re.IGNORECASE
+
+    def _translate_tokens(self, fmt):
+        pattern = []
+        fields = []
+        groups = set()
+        position = 0
+        for match in self._TOKEN_RE.finditer(fmt):
+            pattern.append(re.escape(fmt[position:match.start()]))
+            token = match.group(0)
+            position = match.end()
+            if token.startswith('[') and token.endswith(']'):
+                pattern.append(re.escape(token[1:-1]))
+                continue
+            if token not in self._TOKENS:
+                raise ValueError(f'unsupported parse token: {token!r} in {fmt!r}')
+            field, regex = self._TOKENS[token]
+            group = self._GROUPS.get(field, field)
+            if group is not None and group in groups:
+                raise ValueError(f'duplicate parse token: {token!r} in {fmt!r}')
+            groups.add(group)
+            pattern.append(f'({self._pattern(field, regex)})')
+            fields.append(field)
+        pattern.append(re.escape(fmt[position:]))
+        return ''.join(pattern), fields, 0
+
+
+class BulkParser:
+    _ERRORS = ('raise', 'coerce', 'skip')
+    _SAMPLES = 16
+
+    def __init__(self, factory, tz=None, fmt=None):
+        self.factory = factory
+        self.tzinfo = TzInfo.parse(tz)
+        self.fmt = fmt
+        self.plan = factory.compile_strptime(fmt) if fmt else None
+        self.parser = self._strptime if fmt else None
+        self.invalid = 0
+
+    def parse(self, iterable, errors='raise'):
+        if errors not in self._ERRORS:
+            raise ValueError(f'invalid errors: {errors!r} not in {self._ERRORS}')
+        self.invalid = 0
+        return self._parse(iter(iterable), errors)
+
+    def infer(self, samples):
+        shapes = Counter(self._shape(i) for i in samples if i is not None)
+        if not shapes:
+            return self._generic
+        shape, _ = shapes.most_common(1)[0]
+        return getattr(self, f'_{shape}')
+
+    ###################
+    # Private Methods #
+    ###################
+
+    def _parse(self, iterator, errors):
+        samples = list(islice(iterator, self._SAMPLES))
+        if self.parser is None:
+            self.parser = self.infer(samples)
+
+        parser = self.parser
+        strict = self.fmt is not None
+        for item in chain(samples, iterator):
+            result = parser(item)
+            if result is None and not strict and parser != self._generic:
+                result = self._generic(item)
+            if result is None:
+                if errors == 'raise':
+                    raise ValueError(f'invalid timestamp: {item!r}')
+                self.invalid += 1
+                if errors == 'skip':
+                    continue
+            yield result
+
+    @staticmethod
+    def _shape(item):
+        if isinstance(item, bool):
+            return 'generic'
+        elif isinstance(item, (int, float)):
+            return 'epoch'
+        elif isinstance(item, str):
+            if IsoParser._ISO_RE.fullmatch(item):
+                return 'iso'
+            try:
+                float(item)
+            except ValueError:
+                return 'generic'
+            return 'epoch'
+        return 'generic'
+
+    def _epoch(self, item):
+        if isinstance(item, bool):
+            return None
+        try:
+            timestamp = util.validate_timestamp(float(item))
+            return self.factory._wrap(datetime.fromtimestamp(timestamp, self.tzinfo))
+        except (TypeError, ValueError, OverflowError, OSError):
+            return None
+
+    def _generic(self, item):
+        try:
+            return self.factory.get(item, tzinfo=self.tzinfo)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    def _iso(self, item):
+        if not isinstance(item, str):
+            return None
+        dt = IsoParser.match(item)
+        if dt is None:
+            return None
+        return self.factory._wrap(dt.replace(tzinfo=self.tzinfo))
+
+    def _strptime(self, item):
+        try:
+            return self.plan(item, tzinfo=self.tzinfo)
+        except (TypeError, ValueError):
+            return None
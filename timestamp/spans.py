@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+from . import parser, util
+
+_FIELDS = (('month', 1), ('day', 1), ('hour', 0), ('minute', 0), ('second', 0), ('microsecond', 0))
+_DEPTH = {
+    'year': 0,
+    'quarter': 1,
+    'month': 1,
+    'week': 2,
+    'day': 2,
+    'hour': 3,
+    'minute': 4,
+    'second': 5,
+    'microsecond': 6,
+}
+
+
+class SpanEngine:
+    _RESET = {frame: dict(_FIELDS[depth:], fold=0) for frame, depth in _DEPTH.items()}
+
+    @classmethod
+    def floor(cls, dt, absolute):
+        floor = dt.replace(**cls._RESET[absolute])
+        if absolute == 'week':
+            return parser.TzInfo.resolve(floor - timedelta(days=dt.weekday()))
+        elif absolute == 'quarter':
+            return parser.TzInfo.resolve(floor.replace(month=dt.month - (dt.month - 1) % 3))
+        return floor
+
+    @classmethod
+    def ceil(cls, floor, relative, amount):
+        if relative == 'months':
+            ceil = util.add_months(floor, amount)
+        elif relative == 'years':
+            ceil = util.add_months(floor, amount * 12)
+        else:
+            ceil = floor + timedelta(**{relative: amount})
+        return parser.TzInfo.resolve(ceil)
+
+    @classmethod
+    def span(cls, dt, frames, count=1, bounds='[)', exact=False):
+        absolute, relative, steps = frames
+        floor = dt if exact else cls.floor(dt, absolute)
+        ceil = cls.ceil(floor, relative, count * steps)
+
+        if bounds[0] == '(':
+            floor = parser.TzInfo.resolve(floor + util.MICROSECOND)
+        if bounds[1] == ')':
+            ceil = parser.TzInfo.resolve(ceil - util.MICROSECOND)
+
+        return floor, ceil
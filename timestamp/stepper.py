@@ -0,0 +1,203 @@
+from datetime import datetime, timedelta
+
+from . import parser, util
+
+
+class Stepper:
+    _CLIPPED = ('month', 'quarter', 'year')
+
+    def __init__(self, start, frame, relative, steps):
+        self.start = start
+        self.tzinfo = start.tzinfo
+        self.clipped = frame in self._CLIPPED
+        if relative in ('months', 'years'):
+            self.months = steps * 12 if relative == 'years' else steps
+            self.step = None
+        else:
+            self.months = None
+            self.step = timedelta(**{relative: steps})
+
+        self._naive = start.replace(tzinfo=None)
+        self._midnight = datetime(start.year, start.month, start.day)
+        self._time = self._naive - self._midnight
+
+    def __iter__(self):
+        current = self.start
+        dayclipped = False
+        while True:
+            yield current
+            if self.step is not None:
+                current = parser.TzInfo.resolve(current + self.step)
+                continue
+
+            current = parser.TzInfo.resolve(util.add_months(current, self.months))
+            if self.clipped and current.day < self.start.day:
+                dayclipped = True
+            if dayclipped and current.day != util.days_in_month(current.year, current.month):
+                current = current.replace(day=self.start.day)
+
+    def nth(self, n):
+        if n < 0:
+            raise IndexError(f'step out of range: {n!r}')
+        if n == 0:
+            return self.start
+        if self.step is not None:
+            return self._nth_fixed(n).replace(tzinfo=self.tzinfo)
+        return self._nth_months(n).replace(tzinfo=self.tzinfo)
+
+    ###################
+    # Private Methods #
+    ###################
+
+    def _gaps(self, until):
+        if isinstance(self.tzinfo, parser.TzInfo._FIXED):
+            return
+        year = max(util.MIN_YEAR + 1, self._naive.year - 1)
+        while year <= min(util.MAX_YEAR - 1, until().year + 1):
+            for gap in parser.TzInfo.gaps(self.tzinfo, year):
+                if gap[1] > self._naive:
+                    yield gap
+            year += 1
+
+    def _nth_fixed(self, n):
+        base = self._naive
+        step = self.step // util.MICROSECOND
+        drift = timedelta(0)
+
+        for start, end in self._gaps(lambda: base + self.step * n + drift):
+            k = max(1, -((base + drift - start) // util.MICROSECOND // step))
+            if k > n:
+                break
+            if base + self.step * k + drift < end:
+                drift += end - start
+
+        return base + self.step * n + drift
+
+    def _month(self, k):
+        year, month = divmod(self._midnight.year * 12 + self._midnight.month - 1 + k * self.months, 12)
+        return year, month + 1, util.days_in_month(year, month + 1)
+
+    def _days(self, k):
+        day = self._naive.day
+        if self.clipped:
+            previous = day if k == 1 else min(day, self._month(k - 1)[2])
+            length = self._month(k)[2]
+            return min(previous, length), min(day, length)
+
+        for i in range(1, min(k, 4800) + 1):
+            if day <= 28:
+                break
+            day = min(day, self._month(i)[2])
+        return day, day
+
+    def _nth_months(self, n):
+        origin = self._midnight.year * 12 + self._midnight.month - 1
+        drift = timedelta(0)
+
+        last = self._month(n)
+        for start, end in self._gaps(lambda: datetime(last[0], last[1], 1)):
+            for moment in sorted({start.date(), (end - util.MICROSECOND).date()}):
+                months = moment.year * 12 + moment.month - 1 - origin
+                if months <= 0 or months % self.months:
+                    continue
+                k = months // self.months
+                if k > n or self._days(k)[0] != moment.day:
+                    continue
+                value = datetime(moment.year, moment.month, moment.day) + self._time + drift
+                if start <= value < end:
+                    drift += end - start
+
+        year, month, _ = last
+        return datetime(year, month, self._days(n)[1]) + self._time + drift
+
+
+class TimestampRange:
+    def __init__(self, factory, steps, indices):
+        self._factory = factory
+        self._steps = steps
+        self._indices = indices
+
+    def __contains__(self, item):
+        return self._position(item) is not None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.__class__(self._factory, self._steps, self._indices[index])
+        return self._factory._wrap(self._steps.nth(self._indices[index]))
+
+    def __iter__(self):
+        indices = self._indices
+        if indices.step == 1 and indices.start == 0:
+            for _, current in zip(indices, self._steps):
+                yield self._factory._wrap(current)
+        else:
+            for i in indices:
+                yield self._factory._wrap(self._steps.nth(i))
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __repr__(self):
+        return '{}({!r}, len={})'.format(self.__class__.__name__, self._steps.start.isoformat(), len(self))
+
+    def __reversed__(self):
+        for i in reversed(self._indices):
+            yield self._factory._wrap(self._steps.nth(i))
+
+    def index(self, item):
+        position = self._position(item)
+        if position is None:
+            raise ValueError(f'{item!r} is not in range')
+        return position
+
+    @classmethod
+    def create(cls, factory, steps, end, limit):
+        if steps.start > end or limit < 1:
+            return cls(factory, steps, range(0))
+
+        if steps.step is not None:
+            upper = (end - steps.start) // steps.step
+        else:
+            upper = (end.year * 12 + end.month - steps.start.year * 12 - steps.start.month) // steps.months
+        upper = min(upper + 1, limit - 1)
+
+        lower = 0
+        while lower < upper:
+            middle = (lower + upper + 1) // 2
+            if cls._before(steps, middle, end):
+                lower = middle
+            else:
+                upper = middle - 1
+        return cls(factory, steps, range(lower + 1))
+
+    ###################
+    # Private Methods #
+    ###################
+
+    @staticmethod
+    def _before(steps, n, end):
+        try:
+            return steps.nth(n) <= end
+        except (OverflowError, ValueError):
+            return False
+
+    def _position(self, item):
+        indices = self._indices
+        if not indices:
+            return None
+        other = item if self._factory.is_self(item) else self._factory.get(item)
+        if other is None:
+            return None
+
+        target = util.epoch_us(other.datetime)
+        lower, upper = min(indices[0], indices[-1]), max(indices[0], indices[-1])
+        while lower < upper:
+            middle = (lower + upper) // 2
+            if util.epoch_us(self._steps.nth(middle)) < target:
+                lower = middle + 1
+            else:
+                upper = middle
+
+        if lower not in indices or self._factory._wrap(self._steps.nth(lower)) != other:
+            return None
+        return indices.index(lower)
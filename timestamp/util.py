@@ -1,5 +1,6 @@
-from calendar import monthrange
-from datetime import datetime
+import math
+import sys
+from datetime import datetime, timedelta, timezone
 
 MIN_TIMESTAMP = datetime(1, 1, 2).timestamp()
 
@@ -13,13 +14,101 @@ MIN_YEAR = datetime.min.year
 MAX_ORDINAL = datetime.max.toordinal()
 MIN_ORDINAL = 1
 
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+EPOCH_NAIVE = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_UNITS = {'s': 1, 'ms': 1_000, 'us': 1_000_000, 'ns': 1_000_000_000}
+
+
+def epoch_us(dt):
+    if dt.tzinfo is None:
+        return (dt - EPOCH_NAIVE) // MICROSECOND
+    return (dt - EPOCH) // MICROSECOND
+
+
+def epoch_us_many(values, unit='auto'):
+    if unit != 'auto' and unit not in _UNITS:
+        raise ValueError(f"invalid unit: {unit!r} not in ('auto', 's', 'ms', 'us', 'ns')")
+    if hasattr(values, 'tolist'):
+        values = values.tolist()
+    elif not isinstance(values, (list, tuple)):
+        values = list(values)
+    if not values:
+        return []
+
+    for value in values:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            raise ValueError(f'invalid timestamp: {value!r}')
+
+    lo, hi = min(values), max(values)
+    if unit == 'auto':
+        unit = timestamp_unit(hi)
+    per_second = _UNITS[unit]
+    if lo / per_second < MIN_TIMESTAMP:
+        raise ValueError(f'timestamp too small: {lo!r}')
+    if hi / per_second > MAX_TIMESTAMP:
+        raise ValueError(f'timestamp too large: {hi!r}')
+
+    scale = 1_000_000 // per_second if per_second <= 1_000_000 else None
+    result = []
+    for value in values:
+        if value.__class__ is not int:
+            result.append(_float_us(value / per_second if per_second > 1 else value))
+        elif scale is not None:
+            result.append(value * scale)
+        else:
+            result.append(_round_half_even(value, 1_000))
+    return result
+
+
+def from_epoch_us(value):
+    return EPOCH_NAIVE + timedelta(microseconds=value)
+
+
+def days_in_month(year, month):
+    if month == 2 and isleap(year):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+def fromisocalendar(year, week, weekday):
+    if not 0 < weekday < 8:
+        raise ValueError(f'invalid weekday: {weekday!r}')
+    jan4 = datetime(year, 1, 4)
+    first = jan4.weekday()
+    weeks = 53 if first == 6 or (first == 5 and isleap(year)) else 52
+    if not 0 < week <= weeks:
+        raise ValueError(f'invalid week: {week!r}')
+    ordinal = jan4.toordinal() + (week - 1) * 7 + weekday - 1 - first
+    if not MIN_ORDINAL <= ordinal <= MAX_ORDINAL:
+        raise ValueError(f'year is out of range: {year!r}')
+    return datetime.fromordinal(ordinal)
+
+
+def is_objectid(obj):
+    bson = sys.modules.get('bson')
+    return bson is not None and isinstance(obj, bson.ObjectId)
+
+
+def is_relativedelta(obj):
+    module = sys.modules.get('dateutil.relativedelta')
+    return module is not None and isinstance(obj, module.relativedelta)
+
+
+def isleap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
 
 def safe_date(year, month, day, hour, minute, second, microsecond):
-    MAX_DAY = monthrange(year, month)[-1]
+    year = MIN_YEAR if year < MIN_YEAR else (MAX_YEAR if year > MAX_YEAR else year)
+    month = 1 if month < 1 else (12 if month > 12 else month)
+    MAX_DAY = days_in_month(year, month)
 
     return {
-        'year': MIN_YEAR if year < MIN_YEAR else (MAX_YEAR if year > MAX_YEAR else year),
-        'month': 1 if month < 1 else (12 if month > 12 else month),
+        'year': year,
+        'month': month,
         'day': 1 if day < 1 else (MAX_DAY if day > MAX_DAY else day),
         'hour': 0 if hour < 0 else (23 if hour > 23 else hour),
         'minute': 0 if minute < 0 else (59 if minute > 59 else minute),
@@ -40,6 +129,18 @@ def validate_ordinal(ordinal):
         raise ValueError(f'ordinal out of range: {ordinal!r}')
 
 
+def timestamp_unit(timestamp):
+    if timestamp <= MAX_TIMESTAMP:
+        return 's'
+    elif timestamp < MAX_TIMESTAMP_MS:
+        return 'ms'
+    elif timestamp < MAX_TIMESTAMP_US:
+        return 'us'
+    elif timestamp < MAX_TIMESTAMP_US * 1e3:
+        return 'ns'
+    raise ValueError(f'timestamp too large: {timestamp!r}')
+
+
 def validate_timestamp(timestamp):
     if timestamp < MIN_TIMESTAMP:
         raise ValueError(f'timestamp too small: {timestamp!r}')
@@ -51,3 +152,21 @@ def validate_timestamp(timestamp):
         else:
             raise ValueError(f'timestamp too large: {timestamp!r}')
     return timestamp
+
+
+def add_months(dt, months):
+    year, month = divmod(dt.year * 12 + dt.month - 1 + months, 12)
+    day = min(dt.day, days_in_month(year, month + 1))
+    return dt.replace(year=year, month=month + 1, day=day)
+
+
+def _float_us(seconds):
+    fraction, whole = math.modf(seconds)
+    return int(whole) * 1_000_000 + round(fraction * 1e6)
+
+
+def _round_half_even(value, divisor):
+    quotient, remainder = divmod(value, divisor)
+    if remainder * 2 > divisor or (remainder * 2 == divisor and quotient % 2):
+        quotient += 1
+    return quotient
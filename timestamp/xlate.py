@@ -1,10 +1,14 @@
 import re
-from . import Timestamp
+from collections import namedtuple
+
+from . import clocks, parser
+
+Rule = namedtuple('Rule', ['handler', 'frame'])
 
 
 class TSXlate:
-    _rexlate = re.compile(r'^(?P<num>[\d]*)[-]?(?P<frame>[minute|hour|day|week|month|year]*[s]?)$')
-    _redatetime = re.compile(
+    _REXLATE = re.compile(r'^(?P<num>[-]?[\d]*)(?P<frame>[minute|hour|day|week|month|quarter|year]*[s]?)$')
+    _RESTAMP = re.compile(
         r'^(?P<year>[\d]{2,4})[-/]?'
         r'(?P<month>[\d]{1,2})[-/]?'
         r'(?P<day>[\d]{1,2})[\sT]?'
@@ -15,3 +19,143 @@ class TSXlate:
         r'(?P<tzoffset>[+-]?[\d]{0,2}[:]?[\d]{0,2})[\s]?'
         r'(?P<tzname>[\w]*[/]?[\w]*)$'
     )
+    _ATTRS = ('year', 'month', 'day', 'hour', 'minute', 'second', 'microsecond')
+    _FRAMES = ('static', 'hour', 'day', 'week', 'month', 'quarter', 'year', None)
+
+    _RULES = {}
+    _PATTERNS = []
+    _CACHE = {}
+    _CACHE_SIZE = 1024
+
+    @classmethod
+    def register(cls, name, handler=None, frame=None):
+        if handler is None:
+            return lambda h: cls.register(name, h, frame=frame) or h
+        cls._validate_frame(frame)
+        cls._RULES[name] = Rule(handler, frame)
+        cls._CACHE.clear()
+
+    @classmethod
+    def register_pattern(cls, pattern, handler=None, frame=None):
+        if handler is None:
+            return lambda h: cls.register_pattern(pattern, h, frame=frame) or h
+        cls._validate_frame(frame)
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+        cls._PATTERNS.insert(0, (pattern, Rule(handler, frame)))
+        cls._CACHE.clear()
+
+    @classmethod
+    def unregister(cls, name):
+        cls._RULES.pop(name, None)
+        cls._PATTERNS[:] = [(p, r) for p, r in cls._PATTERNS if name not in (p, p.pattern)]
+        cls._CACHE.clear()
+
+    @classmethod
+    def cache_clear(cls):
+        cls._CACHE.clear()
+
+    @classmethod
+    def xlate(cls, factory, rule, is_from=True, tz=None, clock=None):
+        tzinfo = parser.TzInfo.parse(tz)
+        now = clocks.now(tzinfo, clock)
+
+        key = (factory, rule, is_from, id(tzinfo))
+        cached = cls._CACHE.get(key)
+        if cached is not None and cached[0] is tzinfo and (cached[1] is None or cached[1] <= now <= cached[2]):
+            return cached[3] if cached[3] is None else factory._wrap(cached[3])
+
+        (handler, frame), match = cls._resolve(rule)
+        current = factory._wrap(now)
+        result = handler(current, is_from, match) if match is not None else handler(current, is_from)
+
+        if frame == 'static':
+            lower = upper = None
+        else:
+            lower, upper = current.span(frame or 'second')
+            lower, upper = lower.datetime, upper.datetime
+
+        if len(cls._CACHE) >= cls._CACHE_SIZE:
+            cls._CACHE.clear()
+        if result is None or factory.is_self(result):
+            cls._CACHE[key] = (tzinfo, lower, upper, None if result is None else result.datetime)
+        return result
+
+    ###################
+    # Private Methods #
+    ###################
+
+    @classmethod
+    def _resolve(cls, rule):
+        found = cls._RULES.get(rule)
+        if found is not None:
+            return found, None
+        for pattern, found in cls._PATTERNS:
+            match = pattern.match(rule)
+            if match:
+                return found, match
+        raise ValueError(f'not supported: {rule!r}')
+
+    @classmethod
+    def _validate_frame(cls, frame):
+        if frame not in cls._FRAMES:
+            raise ValueError(f'invalid frame: {frame!r} not in {cls._FRAMES}')
+
+
+def _span(frame, **shift):
+    def handler(now, is_from):
+        if shift:
+            now = now.shift(**shift)
+        return now.floor(frame) if is_from else now.ceil(frame)
+    return handler
+
+
+def _default(now, is_from):
+    return now.shift(days=-32) if is_from else now
+
+
+def _now(now, is_from):
+    return now
+
+
+def _lastquarter(now, is_from):
+    now = now.floor('quarter').shift(quarter=-1)
+    return now.floor('quarter') if is_from else now.ceil('quarter')
+
+
+def _bot(now, is_from):
+    return now.replace(year=2008).floor('year')
+
+
+def _restamp(now, is_from, match):
+    result = {}
+    m = match.groupdict()
+    for k, v in m.items():
+        if k in TSXlate._ATTRS:
+            result[k] = int(v) if v else 0
+    result['tzinfo'] = m['tzname'] or m['tzoffset'] or None
+    dt = now.__class__(**result)
+    return dt.to('UTC') if dt else None
+
+
+def _rexlate(now, is_from, match):
+    m = match.groupdict()
+    return now.shift(**{m['frame']: int(m['num'])})
+
+
+TSXlate.register_pattern(TSXlate._REXLATE, _rexlate)
+TSXlate.register_pattern(TSXlate._RESTAMP, _restamp, frame='static')
+
+TSXlate.register('default', _default)
+TSXlate.register('current', _now)
+TSXlate.register('now', _now)
+for _frame in ('hour', 'day', 'week', 'month'):
+    TSXlate.register(_frame, _span(_frame), frame=_frame)
+TSXlate.register('lasthour', _span('hour', hour=-1), frame='hour')
+TSXlate.register('yesterday', _span('day', days=-1), frame='day')
+TSXlate.register('lastday', _span('day', days=-1), frame='day')
+TSXlate.register('lastweek', _span('week', weeks=-1), frame='week')
+TSXlate.register('lastmonth', _span('month', months=-1), frame='month')
+TSXlate.register('lastquarter', _lastquarter, frame='quarter')
+TSXlate.register('lastyear', _span('year', year=-1), frame='year')
+TSXlate.register('bot', _bot, frame='static')